@@ -12,6 +12,8 @@ This application provides:
 - Professional logging and error handling
 """
 
+import os
+import re
 import sys
 from datetime import datetime
 from pathlib import Path
@@ -26,6 +28,9 @@ from src.car_scraper.plotters import IndividualListingsPlotter, YearAnalysisPlot
 from src.car_scraper.scrapers import CarScraper
 from src.car_scraper.utils.logger import setup_logger
 
+# Manufacturer and model segments of an otomoto search URL.
+_OTOMOTO_PATH_RE = re.compile(r"/osobowe/([^/]+)/([^/?]+)")
+
 
 @click.group()
 @click.option("--verbose", "-v", is_flag=True, help="Enable verbose logging")
@@ -106,9 +111,7 @@ def scrape(
     # Mode 2: Advanced mode - extract from URL, allow overrides
     elif url:
         # Extract manufacturer and model from URL
-        import re
-
-        url_parts = re.findall(r"/osobowe/([^/]+)/([^/?]+)", url)
+        url_parts = _OTOMOTO_PATH_RE.findall(url)
         if url_parts:
             url_make, url_model = url_parts[0]
         else:
@@ -244,19 +247,29 @@ def status(data_dir: str):
         for model_dir in model_dirs:
             model_name = model_dir.name
 
-            # Check for data files
-            csv_files = list(model_dir.glob("*.csv"))
-            json_files = list(model_dir.glob("*.json"))
+            # Check for data files: one directory read, and each file's stat
+            # comes cached on its DirEntry
+            csv_count = json_count = 0
+            latest_mtime = None
+            with os.scandir(model_dir) as entries:
+                for entry in entries:
+                    if entry.name.endswith(".csv"):
+                        csv_count += 1
+                    elif entry.name.endswith(".json"):
+                        json_count += 1
+                    else:
+                        continue
+                    mtime = entry.stat().st_mtime
+                    if latest_mtime is None or mtime > latest_mtime:
+                        latest_mtime = mtime
 
             logger.info(f"  📁 {model_name}:")
-            logger.info(f"    CSV files: {len(csv_files)}")
-            logger.info(f"    JSON files: {len(json_files)}")
+            logger.info(f"    CSV files: {csv_count}")
+            logger.info(f"    JSON files: {json_count}")
 
             # Get latest file modification time
-            all_files = csv_files + json_files
-            if all_files:
-                latest_file = max(all_files, key=lambda f: f.stat().st_mtime)
-                latest_time = datetime.fromtimestamp(latest_file.stat().st_mtime)
+            if latest_mtime is not None:
+                latest_time = datetime.fromtimestamp(latest_mtime)
                 logger.info(
                     f"    Last updated: {latest_time.strftime('%Y-%m-%d %H:%M:%S')}"
                 )
@@ -292,7 +305,8 @@ def scrape_all(targets_file: str, data_dir: str, max_pages: int, alerts_file: st
     storage = SimplifiedListingsStorage(data_dir)
     current_date = datetime.now().strftime("%Y-%m-%d")
 
-    all_new, all_drops = [], []
+    all_new: list[dict] = []
+    all_drops: list[dict] = []
     for target in targets:
         key = target["key"]
         label = target.get("label", key)
@@ -314,12 +328,12 @@ def scrape_all(targets_file: str, data_dir: str, max_pages: int, alerts_file: st
             continue
         try:
             result = storage.store_listings_data(key, listings, current_date)
-            for item in result["new"]:
-                item["_model_label"] = label
-            for drop in result["price_drops"]:
-                drop["listing"]["_model_label"] = label
-            all_new.extend(result["new"])
-            all_drops.extend(result["price_drops"])
+            # Tag copies: the stored listing dicts stay cached by the storage.
+            all_new.extend({**item, "_model_label": label} for item in result["new"])
+            all_drops.extend(
+                {**drop, "listing": {**drop["listing"], "_model_label": label}}
+                for drop in result["price_drops"]
+            )
             click.echo(
                 f"  {result['total']} tracked, {len(result['new'])} new, "
                 f"{len(result['price_drops'])} price drops"
@@ -358,5 +372,22 @@ def report(data_dir: str, output: str, targets_file: str):
     click.echo(f"🖥️  Dashboard: {path}")
 
 
+@cli.command(name="pretty-print")
+@click.argument("file", type=click.Path(exists=True, dir_okay=False, path_type=Path))
+@click.option(
+    "--in-place", is_flag=True, help="Rewrite FILE indented instead of printing it"
+)
+def pretty_print(file: Path, in_place: bool):
+    """🔎 Show a compact (or .gz) JSON data file with indentation."""
+    from src.car_scraper.utils.fileio import dumps_json, read_json, write_json
+
+    data = read_json(file)
+    if in_place:
+        write_json(file, data)
+        click.echo(f"Rewrote {file} indented")
+    else:
+        click.echo(dumps_json(data).decode("utf-8"))
+
+
 if __name__ == "__main__":
     cli()
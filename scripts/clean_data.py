@@ -12,7 +12,8 @@ This script, run once over a model file, does the obvious data engineering:
      current/initial price + price_change from what survives,
   3. drops a listing entirely if no valid price reading remains.
 
-It prints a report and writes a .pre-clean backup. New data from the rewritten
+It prints a report and writes a .pre-clean backup (skipped, along with the
+rewrite itself, when nothing needed cleaning). New data from the rewritten
 scraper reads otomoto's structured price field and never has these bugs.
 
 Usage:
@@ -27,7 +28,7 @@ from pathlib import Path
 
 
 def clean(data_file: Path, price_min: int, price_max: int, exclude: list[str]) -> dict:
-    """Clean one model file; return {data, report, before, after} (no write)."""
+    """Clean one model file; return {data, report, before, after, changed} (no write)."""
     data = json.loads(data_file.read_text(encoding="utf-8"))
     if not (isinstance(data, dict) and "listings" in data):
         raise SystemExit(f"{data_file} is not in the expected {{listings: ...}} format")
@@ -35,6 +36,7 @@ def clean(data_file: Path, price_min: int, price_max: int, exclude: list[str]) -
     listings = data["listings"]
     report: dict = {"removed_variant": [], "removed_no_price": [], "fixed_readings": []}
     kept = {}
+    changed = False
 
     for lid, car in listings.items():
         title = (car.get("title") or "").lower()
@@ -45,16 +47,19 @@ def clean(data_file: Path, price_min: int, price_max: int, exclude: list[str]) -
             continue
 
         # Sanitize price history.
-        readings = car.get("price_readings") or []
-        good = [
-            r
-            for r in readings
-            if isinstance(r, list)
-            and len(r) == 2
-            and isinstance(r[1], (int, float))
-            and price_min <= r[1] <= price_max
-        ]
-        dropped = [r for r in readings if r not in good]
+        # One pass splits readings into kept and dropped (no per-reading
+        # membership scan of the kept list).
+        good, dropped = [], []
+        for r in car.get("price_readings") or []:
+            if (
+                isinstance(r, list)
+                and len(r) == 2
+                and isinstance(r[1], (int, float))
+                and price_min <= r[1] <= price_max
+            ):
+                good.append(r)
+            else:
+                dropped.append(r)
 
         if not good:
             # Fall back to current_price if it is itself sane (no readings case).
@@ -76,17 +81,28 @@ def clean(data_file: Path, price_min: int, price_max: int, exclude: list[str]) -
             )
 
         good.sort(key=lambda r: r[0])
-        car["price_readings"] = good
-        car["initial_price"] = good[0][1]
-        car["current_price"] = good[-1][1]
-        car["price_change"] = good[-1][1] - (
-            good[-2][1] if len(good) > 1 else good[0][1]
-        )
+        fields = {
+            "price_readings": good,
+            "initial_price": good[0][1],
+            "current_price": good[-1][1],
+            "price_change": good[-1][1]
+            - (good[-2][1] if len(good) > 1 else good[0][1]),
+        }
+        if any(car.get(k) != v for k, v in fields.items()):
+            car.update(fields)
+            changed = True
         kept[lid] = car
 
+    changed = changed or len(kept) != len(listings)
     data["listings"] = kept
     data.setdefault("metadata", {})["total_listings"] = len(kept)
-    return {"data": data, "report": report, "before": len(listings), "after": len(kept)}
+    return {
+        "data": data,
+        "report": report,
+        "before": len(listings),
+        "after": len(kept),
+        "changed": changed,
+    }
 
 
 def main() -> None:
@@ -115,6 +131,9 @@ def main() -> None:
     if args.dry_run:
         print("\n(dry run — nothing written)")
         return
+    if not out["changed"]:
+        print("\nNothing to clean — file left untouched")
+        return
 
     backup = args.data_file.with_suffix(args.data_file.suffix + ".pre-clean")
     shutil.copy2(args.data_file, backup)
@@ -117,6 +117,7 @@ _COUNTRIES: list[tuple[str, str, re.Pattern[str], list[str]]] = [
 # beat the Poland default; an explicit domestic claim beats "imported".
 _IMPORT_RX = re.compile(r"sprowadz|importowan|\bimport\b|zagranic")
 _DOMESTIC_RX = re.compile(r"krajow|salon polska|pierwszy wlascic|\bpolski\b")
+_WORD_RX = re.compile(r"[a-z]+")
 _IMPORT_FUZZY = ["sprowadzony", "sprowadzona", "importowany"]
 _FUZZY_CUTOFF = 0.86
 
@@ -152,7 +153,7 @@ def _resolve_country(text: str, listing: dict) -> tuple[str, str]:
     if label:
         return label, (listing.get("country") or "")
     folded = _fold(text)
-    tokens = [w for w in re.findall(r"[a-z]+", folded) if len(w) >= 5]
+    tokens = [w for w in _WORD_RX.findall(folded) if len(w) >= 5]
     country = _match_country(folded, tokens)
     if country:
         return country
@@ -176,6 +177,11 @@ def _first(text: str, pairs: list[tuple[str, re.Pattern[str]]]) -> str | None:
     return None
 
 
+_LC_HYBRID_RX = re.compile(r"\b500h\b", re.I)
+_CONVERTIBLE_RX = re.compile(r"cabrio|kabrio|convertible|roadster", re.I)
+_SUPERTURISMO_RX = re.compile(r"super\s?turismo", re.I)
+_CARBON_RX = re.compile(r"\bcarbon\b", re.I)
+
 _LC_TRIM = [
     ("Inspiration Series", _kw("inspiration")),
     ("Bespoke", _kw("bespoke")),
@@ -187,20 +193,14 @@ def _lexus_lc(text: str, listing: dict) -> dict:
     """LC 500 (5.0 V8) vs 500h (3.5 V6 hybrid); body + trim from the marketing text."""
     cap = listing.get("engine_capacity") or 0
     fuel = (listing.get("fuel_type") or "").lower()
-    is_h = (
-        fuel == "hybrid" or bool(re.search(r"\b500h\b", text, re.I)) or 0 < cap < 4000
-    )
+    is_h = fuel == "hybrid" or bool(_LC_HYBRID_RX.search(text)) or 0 < cap < 4000
     variant = "500h" if is_h else "500"
 
-    body = (
-        "Convertible"
-        if re.search(r"cabrio|kabrio|convertible|roadster", text, re.I)
-        else "Coupé"
-    )
+    body = "Convertible" if _CONVERTIBLE_RX.search(text) else "Coupé"
 
-    superturismo = re.search(r"super\s?turismo", text, re.I)
+    superturismo = _SUPERTURISMO_RX.search(text)
     trim: str | None
-    if superturismo and re.search(r"\bcarbon\b", text, re.I):
+    if superturismo and _CARBON_RX.search(text):
         trim = "Superturismo Carbon"
     elif superturismo:
         trim = "Superturismo"
@@ -209,6 +209,8 @@ def _lexus_lc(text: str, listing: dict) -> dict:
     return {"variant": variant, "body": body, "trim": trim}
 
 
+_MX5_RF_RX = re.compile(r"\brf\b", re.I)
+
 _MX5_TRIM = [
     ("Homura", _kw("homura")),
     ("Sports-Line", _kw("sports-?line")),
@@ -225,7 +227,7 @@ _MX5_TRIM = [
 
 def _mazda_mx5(text: str, _listing: dict) -> dict:
     """MX-5 RF (retractable hardtop) vs Soft-top (roadster) + trim line."""
-    body = "RF" if re.search(r"\brf\b", text, re.I) else "Soft-top"
+    body = "RF" if _MX5_RF_RX.search(text) else "Soft-top"
     return {"body": body, "trim": _first(text, _MX5_TRIM)}
 
 
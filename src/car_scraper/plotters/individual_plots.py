@@ -48,6 +48,26 @@ class IndividualListingsPlotter:
         else:
             return self.plots_dir
 
+    @staticmethod
+    def _valid_listing_groups(
+        df: pd.DataFrame, min_data_points: int
+    ) -> list[tuple[str, pd.DataFrame]]:
+        """
+        Group readings by listing, keeping listings with enough priced points
+
+        Args:
+            df: Historical data with ``id`` and ``price`` columns
+            min_data_points: Minimum number of non-null prices per listing
+
+        Returns:
+            ``(listing_id, group)`` pairs sorted by listing id
+        """
+        # One vectorized count per id instead of a Python check per group;
+        # only the listings that qualify are split into groups.
+        price_counts = df.groupby("id")["price"].count()
+        valid_ids = price_counts.index[price_counts >= min_data_points]
+        return list(df[df["id"].isin(valid_ids)].groupby("id"))
+
     def generate_individual_listing_plots(
         self, model: str | None = None, min_data_points: int = 1
     ) -> None:
@@ -71,15 +91,7 @@ class IndividualListingsPlotter:
         df["date"] = pd.to_datetime(df["date"])
 
         # Group by listing ID and filter listings with multiple data points
-        listing_groups = df.groupby("id")
-        valid_listings = []
-
-        for listing_id, group in listing_groups:
-            if (
-                len(group) >= min_data_points
-                and group["price"].notna().sum() >= min_data_points
-            ):
-                valid_listings.append((listing_id, group))
+        valid_listings = self._valid_listing_groups(df, min_data_points)
 
         if not valid_listings:
             logger.warning(
@@ -276,15 +288,7 @@ class IndividualListingsPlotter:
         df["year"] = pd.to_numeric(df["year"], errors="coerce")
 
         # Group by listing ID and filter listings with multiple data points
-        listing_groups = df.groupby("id")
-        valid_listings = []
-
-        for listing_id, group in listing_groups:
-            if (
-                len(group) >= min_data_points
-                and group["price"].notna().sum() >= min_data_points
-            ):
-                valid_listings.append((listing_id, group))
+        valid_listings = self._valid_listing_groups(df, min_data_points)
 
         if not valid_listings:
             logger.warning(
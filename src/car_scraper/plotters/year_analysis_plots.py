@@ -255,9 +255,15 @@ class YearAnalysisPlotter:
         for i, year in enumerate(unique_years):
             year_markers[year] = markers[i % len(markers)]
 
-        # Plot each listing with year-based styling
+        # Plot each listing with year-based styling; only the first point of
+        # each year gets a legend label (set lookup, not a legend rescan per row)
+        labelled_years: set[int] = set()
         for _, row in df.iterrows():
             year = row["year"]
+            label = ""
+            if int(year) not in labelled_years:
+                labelled_years.add(int(year))
+                label = f"{int(year)}"
 
             plt.scatter(
                 row["date"],
@@ -266,11 +272,7 @@ class YearAnalysisPlotter:
                 marker=year_markers[year],
                 s=60,
                 alpha=0.7,
-                label=(
-                    f"{int(year)}"
-                    if f"{int(year)}" not in plt.gca().get_legend_handles_labels()[1]
-                    else ""
-                ),
+                label=label,
             )
 
         plt.title(f'Unique Cars by Year{" - " + model if model else ""}')
@@ -152,13 +152,24 @@ def parse_listings(html: str) -> tuple[list[dict], int | None]:
     return listings, total_count
 
 
-def fetch_search_page(url: str, page: int, timeout: int = 30) -> str | None:
-    """Fetch one search results page (1-indexed)."""
+def fetch_search_page(
+    url: str, page: int, timeout: int = 30, client: httpx.Client | None = None
+) -> str | None:
+    """Fetch one search results page (1-indexed).
+
+    Pass ``client`` to reuse its pooled keep-alive connection instead of
+    opening (and TLS-handshaking) a fresh one for this request.
+    """
     if page > 1:
         sep = "&" if "?" in url else "?"
         url = f"{url}{sep}page={page}"
     try:
-        resp = httpx.get(url, headers=_HEADERS, timeout=timeout, follow_redirects=True)
+        if client is not None:
+            resp = client.get(url, timeout=timeout)
+        else:
+            resp = httpx.get(
+                url, headers=_HEADERS, timeout=timeout, follow_redirects=True
+            )
         resp.raise_for_status()
         return resp.text
     except Exception as exc:  # noqa: BLE001 - network errors are expected/logged
@@ -184,27 +195,30 @@ def scrape_search(
         Deduplicated list of clean listing dicts.
     """
     logger.info(f"Scraping search: {search_url}")
-    html = fetch_search_page(search_url, 1)
-    if html is None:
-        return []
-
-    listings, total = parse_listings(html)
-    by_id: dict[str, dict] = {x["id"]: x for x in listings}
-
-    pages_needed = (total + page_size - 1) // page_size if total else 1
-    pages_needed = min(pages_needed, max_pages)
-    logger.info(f"Found {total} listings (~{pages_needed} pages, cap {max_pages})")
-
-    for page in range(2, pages_needed + 1):
-        time.sleep(delay)
-        html = fetch_search_page(search_url, page)
+    # One client for the whole pagination run so every page after the first
+    # reuses the same keep-alive connection.
+    with httpx.Client(headers=_HEADERS, timeout=30, follow_redirects=True) as client:
+        html = fetch_search_page(search_url, 1, client=client)
         if html is None:
-            continue
-        page_listings, _ = parse_listings(html)
-        if not page_listings:
-            break
-        for listing in page_listings:
-            by_id[listing["id"]] = listing
+            return []
+
+        listings, total = parse_listings(html)
+        by_id: dict[str, dict] = {x["id"]: x for x in listings}
+
+        pages_needed = (total + page_size - 1) // page_size if total else 1
+        pages_needed = min(pages_needed, max_pages)
+        logger.info(f"Found {total} listings (~{pages_needed} pages, cap {max_pages})")
+
+        for page in range(2, pages_needed + 1):
+            time.sleep(delay)
+            html = fetch_search_page(search_url, page, client=client)
+            if html is None:
+                continue
+            page_listings, _ = parse_listings(html)
+            if not page_listings:
+                break
+            for listing in page_listings:
+                by_id[listing["id"]] = listing
 
     result = list(by_id.values())
     logger.info(f"Scraped {len(result)} unique listings")
@@ -1,15 +1,42 @@
 """Simplified listings storage with integrated price tracking"""
 
-import json
+import shutil
 import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import suppress
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
+from typing import Any
 
 import click
+import numpy as np
 import pandas as pd
 
+from src.car_scraper.utils.fileio import read_json, write_json
 from src.car_scraper.utils.logger import logger
 
+# Columns of the DataFrame returned by get_historical_data, in order.
+HISTORY_COLUMNS = (
+    "id",
+    "internal_id",
+    "title",
+    "price",
+    "year",
+    "mileage",
+    "url",
+    "model",
+    "date",
+    "scrape_timestamp",
+)
+
+# Integer columns of the history DataFrame, typed up front instead of inferred.
+_HISTORY_DTYPES = {"internal_id": np.int64, "scrape_timestamp": np.int64}
+
+# Basic listing fields refreshed from every scrape, with their default when
+# neither the scrape nor the stored listing has them.
+_BASIC_FIELD_DEFAULTS = (("title", ""), ("year", None), ("mileage", None), ("url", ""))
+
 # Rich fields captured from otomoto's structured data. Carried through on both
 # new and updated listings when present (older data simply won't have them).
 EXTRA_FIELDS = (
@@ -33,6 +60,36 @@ def _carry_extra_fields(source: dict, target: dict) -> None:
             target[field] = source[field]
 
 
+@lru_cache(maxsize=4096)
+def _reading_date(timestamp: int) -> str:
+    """Format a price reading's Unix timestamp as a local ``YYYY-MM-DD`` date.
+
+    Memoized on the exact timestamp: every reading taken in one store call
+    shares ``current_timestamp``, so a model's readings collapse to one entry
+    per scrape run. (Bucketing by ``ts // 86400`` would be wrong here, as that
+    is a UTC day while the dates are local.)
+    """
+    return datetime.fromtimestamp(timestamp).strftime("%Y-%m-%d")
+
+
+def _history_frame(columns: dict[str, list]) -> pd.DataFrame:
+    """Build the history DataFrame, converting the integer columns directly."""
+    data: dict[str, Any] = dict(columns)
+    for name, dtype in _HISTORY_DTYPES.items():
+        # A missing value (e.g. in old data) can't be typed: let pandas infer
+        with suppress(TypeError, ValueError):
+            data[name] = np.array(columns[name], dtype=dtype)
+    return pd.DataFrame(data)
+
+
+def _internal_id_of(listing: dict) -> int:
+    """Return a stored listing's internal ID as an int (0 if missing or invalid)."""
+    try:
+        return int(listing.get("internal_id") or 0)
+    except (ValueError, TypeError):
+        return 0
+
+
 class SimplifiedListingsStorage:
     """Simplified storage handler with integrated price tracking"""
 
@@ -44,6 +101,16 @@ class SimplifiedListingsStorage:
             data_dir: Base data directory
         """
         self.data_dir = Path(data_dir)
+        # Parsed contents per model file, tagged with the file's (mtime_ns, size)
+        # when it was loaded or last saved by this instance.
+        self._file_cache: dict[Path, tuple[tuple[int, int], Any]] = {}
+        # Model files last read in the old list format; the first save backs
+        # each one up before replacing it with the new format.
+        self._old_format_files: set[Path] = set()
+        # Model name -> its (already created) directory.
+        self._model_dir_cache: dict[str, Path] = {}
+        # Model directory scan, tagged with the data directory's stat stamp.
+        self._model_dirs_cache: tuple[tuple[int, int], tuple[Path, ...]] | None = None
 
     def _get_model_dir(self, model: str) -> Path:
         """
@@ -55,8 +122,12 @@ class SimplifiedListingsStorage:
         Returns:
             Path to model directory
         """
-        model_dir = self.data_dir / model.replace("/", "_")
-        model_dir.mkdir(parents=True, exist_ok=True)
+        model_dir = self._model_dir_cache.get(model)
+        if model_dir is None:
+            # Created once per instance; later calls skip the mkdir syscalls.
+            model_dir = self.data_dir / model.replace("/", "_")
+            model_dir.mkdir(parents=True, exist_ok=True)
+            self._model_dir_cache[model] = model_dir
         return model_dir
 
     def _get_model_data_file(self, model: str) -> Path:
@@ -72,6 +143,222 @@ class SimplifiedListingsStorage:
         model_dir = self._get_model_dir(model)
         return model_dir / f"{model.replace('/', '_')}.json"
 
+    @staticmethod
+    def _file_stamp(path: Path) -> tuple[int, int]:
+        """Cheap change marker for a file: ``(mtime_ns, size)``."""
+        st = path.stat()
+        return st.st_mtime_ns, st.st_size
+
+    def _model_dirs(self) -> tuple[Path, ...]:
+        """
+        List the model directories under the data directory
+
+        The scan is reused until the data directory's ``(mtime_ns, nlink)``
+        changes, which happens whenever an entry is added, removed or renamed.
+
+        Returns:
+            Model directories (hidden directories and ``plots`` excluded)
+        """
+        st = self.data_dir.stat()
+        stamp = (st.st_mtime_ns, st.st_nlink)
+        if self._model_dirs_cache is not None and self._model_dirs_cache[0] == stamp:
+            return self._model_dirs_cache[1]
+
+        model_dirs = tuple(
+            d
+            for d in self.data_dir.iterdir()
+            if d.is_dir() and not d.name.startswith(".") and d.name not in ["plots"]
+        )
+        self._model_dirs_cache = (stamp, model_dirs)
+        return model_dirs
+
+    def _read_model_file(self, data_file: Path) -> Any:
+        """
+        Parse a model file, reusing the previous parse while it is unchanged
+
+        The parsed contents are kept on the instance for as long as the file's
+        ``(mtime_ns, size)`` stays the same, so repeated stores and reads of
+        one model in a process (batch runs, backfills, store-then-plot) skip
+        the JSON parse entirely. Callers must not mutate the result unless
+        they save it back (``store_listings_data`` does, then re-caches).
+        Old list-format files are converted in memory only; they are rewritten
+        in the new format by the next save (see ``_write_model_file``).
+
+        Args:
+            data_file: Path to model's JSON file
+
+        Returns:
+            Parsed file contents
+        """
+        stamp = self._file_stamp(data_file)
+        cached = self._file_cache.get(data_file)
+        if cached is not None and cached[0] == stamp:
+            return cached[1]
+
+        data = read_json(data_file)
+        if isinstance(data, list):
+            data = self._convert_old_format(data_file, data)
+            self._old_format_files.add(data_file)
+        else:
+            self._old_format_files.discard(data_file)
+        self._file_cache[data_file] = (stamp, data)
+        return data
+
+    def _write_model_file(self, data_file: Path, data: dict) -> None:
+        """
+        Save a model file and cache what was written
+
+        A file still in the old list format is first copied to
+        ``<name>.pre-migrate``, so the migration to the new format can be
+        undone.
+
+        Args:
+            data_file: Path to model's JSON file
+            data: New-format contents to write
+        """
+        if data_file in self._old_format_files:
+            backup = data_file.with_name(data_file.name + ".pre-migrate")
+            shutil.copy2(data_file, backup)
+            logger.info(f"Migrating {data_file} from the old list format")
+        write_json(data_file, data)
+        self._old_format_files.discard(data_file)
+        # Write-through: what we just saved is the freshest parse.
+        self._file_cache[data_file] = (self._file_stamp(data_file), data)
+
+    @staticmethod
+    def _convert_old_format(data_file: Path, records: list[dict]) -> dict:
+        """
+        Convert old list-format model file contents to the new format
+
+        Old records are one scrape of one listing each, so a listing appears
+        once per scrape date. Its records are grouped and ordered by
+        ``scrape_timestamp``: every priced record becomes a price reading, the
+        first record supplies the ``first_*``/``initial_price`` fields and the
+        last one the ``last_*``/``current_price`` fields. Listings never seen
+        with a price are dropped rather than given a made-up one.
+
+        Args:
+            data_file: Path to model's JSON file
+            records: Parsed old-format contents
+
+        Returns:
+            Contents in the new ``{"metadata": ..., "listings": ...}`` format
+        """
+        model = data_file.stem
+        by_id: dict[str, list[dict]] = {}
+        for record in records:
+            listing_id = record.get("id")
+            if listing_id:
+                by_id.setdefault(listing_id, []).append(record)
+
+        listings = {}
+        for listing_id, group in by_id.items():
+            group.sort(key=lambda r: r.get("scrape_timestamp", 0))
+            first, last = group[0], group[-1]
+            readings = [
+                [r.get("scrape_timestamp", 0), r["price"]]
+                for r in group
+                if (r.get("price") or 0) > 0
+            ]
+            if not readings:
+                continue
+            # As in store_listings_data: the size of the most recent change.
+            price_change = 0
+            for prev, cur in zip(readings, readings[1:], strict=False):
+                if cur[1] != prev[1]:
+                    price_change = cur[1] - prev[1]
+            listing = {
+                "id": listing_id,
+                "internal_id": last.get("internal_id", 0),
+                "title": last.get("title", ""),
+                "initial_price": readings[0][1],
+                "current_price": readings[-1][1],
+                "year": last.get("year"),
+                "mileage": last.get("mileage"),
+                "url": last.get("url", ""),
+                "model": last.get("model", model),
+                "first_seen": first.get("scrape_date", "").split("T")[0],
+                "last_seen": last.get("scrape_date", "").split("T")[0],
+                "first_scrape_timestamp": first.get("scrape_timestamp", 0),
+                "last_scrape_timestamp": last.get("scrape_timestamp", 0),
+                "price_readings": readings,
+                "price_change": price_change,
+                "active": True,
+            }
+            _carry_extra_fields(last, listing)
+            listings[listing_id] = listing
+
+        return {
+            "metadata": {
+                "last_updated": datetime.now().isoformat(),
+                "total_listings": len(listings),
+                "model": model,
+            },
+            "listings": listings,
+        }
+
+    def _load_existing_lookup(self, data_file: Path) -> dict[str, dict]:
+        """
+        Load a model file as an ``{id: listing}`` lookup
+
+        Args:
+            data_file: Path to model's JSON file
+
+        Returns:
+            Listings keyed by id (empty if the file is missing or unreadable)
+        """
+        if not data_file.exists():
+            return {}
+
+        try:
+            file_data = self._read_model_file(data_file)
+        except Exception as e:
+            logger.warning(f"Error loading existing data from {data_file}: {e}")
+            return {}
+
+        if isinstance(file_data, dict) and "listings" in file_data:
+            # Already keyed by id
+            return file_data["listings"]
+        logger.warning(f"Unknown data format in {data_file}")
+        return {}
+
+    @staticmethod
+    def _already_stored(
+        listings: dict[str, dict], scraped: dict[str, dict], date_str: str
+    ) -> bool:
+        """
+        Check whether a scrape is already fully recorded for ``date_str``
+
+        True when every priced scraped listing was last seen on that date at
+        the same price and is still active, and no active listing is missing
+        from the scrape (which would mark it inactive).
+
+        Args:
+            listings: Stored listings keyed by id
+            scraped: Scraped listings keyed by id
+            date_str: Date string in YYYY-MM-DD format
+
+        Returns:
+            Whether storing the scrape would change no prices or statuses
+        """
+        for listing_id, listing_data in scraped.items():
+            price = listing_data.get("price") or 0
+            if price <= 0:
+                continue
+            stored = listings.get(listing_id)
+            if (
+                stored is None
+                or stored.get("last_seen") != date_str
+                or stored.get("current_price") != price
+                or not stored.get("active")
+            ):
+                return False
+        return all(
+            listing_id in scraped
+            for listing_id, stored in listings.items()
+            if stored.get("active")
+        )
+
     def store_listings_data(  # noqa: C901
         self, model: str, listings_data: list[dict], date_str: str
     ) -> dict:
@@ -97,88 +384,73 @@ class SimplifiedListingsStorage:
 
         data_file = self._get_model_data_file(model)
 
-        # Load existing data
-        existing_data = []
-        if data_file.exists():
-            try:
-                with open(data_file, encoding="utf-8") as f:
-                    file_data = json.load(f)
-
-                # Handle both old format (list) and new format (dict with 'listings' key)
-                if isinstance(file_data, list):
-                    existing_data = file_data  # Old format
-                elif isinstance(file_data, dict) and "listings" in file_data:
-                    existing_data = list(file_data["listings"].values())  # New format
-                else:
-                    logger.warning(f"Unknown data format in {data_file}")
-                    existing_data = []
-
-            except Exception as e:
-                logger.warning(f"Error loading existing data from {data_file}: {e}")
-                existing_data = []
-
-        # Create lookup for existing listings
-        existing_lookup = {listing["id"]: listing for listing in existing_data}
+        # id -> listing index of the stored data, cached while the file is
+        # unchanged. It is updated in place (new listings are inserted into it)
+        # and written back out as the file's "listings" mapping.
+        listings = self._load_existing_lookup(data_file)
         current_timestamp = int(time.time())
 
-        # Process new listings
-        updated_data = []
         price_changes = 0
         new_listings = 0
 
-        # First, create lookup for current scrape listings
-        current_listings_lookup = {
-            listing.get("id"): listing for listing in listings_data if listing.get("id")
+        # First, create lookup for current scrape listings (id-less ones skipped)
+        current_listings_lookup: dict[str, dict] = {
+            listing["id"]: listing for listing in listings_data if listing.get("id")
         }
 
-        # Process all existing listings first (to preserve historical data)
-        for existing_listing in existing_data:
-            listing_id = existing_listing.get("id")
-            if not listing_id:
-                continue
+        # Idempotent re-run (e.g. a retried daily job): nothing would change
+        # but scrape timestamps, so skip the merge and the rewrite entirely.
+        if self._already_stored(listings, current_listings_lookup, date_str):
+            logger.info(f"Data for {model} already up to date for {date_str}")
+            summary["total"] = len(listings)
+            return summary
+
+        # The merge updates the cached listings in place; if it fails part-way,
+        # drop the cache entry so the half-merged dict is never served as disk.
+        try:
+            # Listings not in current scrape - preserve them but mark inactive
+            # (sold or de-listed). Historical price readings are kept. The key-set
+            # difference runs in C, so stored listings are not walked in Python.
+            for stale_id in listings.keys() - current_listings_lookup.keys():
+                listings[stale_id]["active"] = False
+
+            # Listings in both the stored data and the current scrape - update them.
+            # Walks the scrape (in scrape order), not the whole stored history.
+            for listing_id, listing_data in current_listings_lookup.items():
+                existing_listing = listings.get(listing_id)
+                if existing_listing is None:
+                    continue
 
-            if listing_id in current_listings_lookup:
-                # Listing exists in current scrape - update it
-                listing_data = current_listings_lookup[listing_id]
                 current_price = listing_data.get("price") or 0
                 if current_price <= 0:
                     # Keep the existing listing unchanged if price is invalid
-                    updated_data.append(existing_listing)
                     continue
 
                 last_price = existing_listing.get(
                     "current_price", existing_listing.get("initial_price", 0)
                 )
 
-                # Update basic info
-                existing_listing.update(
-                    {
-                        "title": listing_data.get(
-                            "title", existing_listing.get("title", "")
-                        ),
-                        "year": listing_data.get("year", existing_listing.get("year")),
-                        "mileage": listing_data.get(
-                            "mileage", existing_listing.get("mileage")
-                        ),
-                        "url": listing_data.get("url", existing_listing.get("url", "")),
-                        "model": model,
-                        "last_seen": date_str,
-                        "last_scrape_timestamp": current_timestamp,
-                        "active": True,
-                    }
-                )
+                # Update basic info, assigned field by field (no temporary dict).
+                # Scraped values win; keys missing from the scrape keep their
+                # stored value, or get the default if there is none.
+                for field, default in _BASIC_FIELD_DEFAULTS:
+                    if field in listing_data:
+                        existing_listing[field] = listing_data[field]
+                    elif field not in existing_listing:
+                        existing_listing[field] = default
+                existing_listing["model"] = model
+                existing_listing["last_seen"] = date_str
+                existing_listing["last_scrape_timestamp"] = current_timestamp
+                existing_listing["active"] = True
                 _carry_extra_fields(listing_data, existing_listing)
 
                 # Initialize price_readings if not exists
-                if "price_readings" not in existing_listing:
-                    existing_listing["price_readings"] = []
+                price_readings = existing_listing.setdefault("price_readings", [])
 
                 # Check for price change
                 if current_price != last_price:
                     price_change = current_price - last_price
-                    existing_listing["price_readings"].append(
-                        [current_timestamp, current_price]
-                    )
+                    price_readings.append([current_timestamp, current_price])
                     existing_listing["price_change"] = price_change
                     price_changes += 1
 
@@ -191,117 +463,152 @@ class SimplifiedListingsStorage:
                             }
                         )
 
-                    logger.info(
-                        f"Price change detected for {listing_id}: {last_price} → {current_price} ({price_change:+d})"
+                    # Per-listing detail at DEBUG only; the message is formatted by
+                    # loguru only if a sink accepts it. The INFO summary after the
+                    # save reports the total.
+                    logger.debug(
+                        "Price change detected for {}: {} → {} ({:+d})",
+                        listing_id,
+                        last_price,
+                        current_price,
+                        price_change,
                     )
 
                 # Always ensure current_price matches the last price reading.
                 # Seed a reading if there was none yet (e.g. migrated old-format
                 # data re-scraped at an unchanged price), so history is never empty.
-                if not existing_listing["price_readings"]:
-                    existing_listing["price_readings"].append(
-                        [current_timestamp, current_price]
-                    )
-                existing_listing["current_price"] = existing_listing["price_readings"][
-                    -1
-                ][1]
-
-                updated_data.append(existing_listing)
-            else:
-                # Listing not in current scrape - preserve it but mark inactive
-                # (sold or de-listed). Historical price readings are kept.
-                existing_listing["active"] = False
-                updated_data.append(existing_listing)
-
-        # Process new listings that weren't in existing data
-        next_internal_id = None  # Track next available internal ID for this batch
-        for listing_data in listings_data:
-            listing_id = listing_data.get("id")
-            if not listing_id:
-                continue
+                if not price_readings:
+                    price_readings.append([current_timestamp, current_price])
+                existing_listing["current_price"] = price_readings[-1][1]
+
+            # Process new listings that weren't in existing data
+            next_internal_id = None  # Track next available internal ID for this batch
+            for listing_data in listings_data:
+                new_id: str | None = listing_data.get("id")
+                if not new_id:
+                    continue
 
-            current_price = listing_data.get("price") or 0
-            if current_price <= 0:
-                continue
+                current_price = listing_data.get("price") or 0
+                if current_price <= 0:
+                    continue
 
-            if listing_id not in existing_lookup:
-                # Calculate next internal ID if not done yet
-                if next_internal_id is None:
-                    # Find the highest existing internal ID from all current data
-                    max_internal_id = 0
-                    for listing in existing_data + updated_data:
-                        internal_id = listing.get("internal_id", 0)
-                        try:
-                            internal_id = int(internal_id) if internal_id else 0
-                        except (ValueError, TypeError):
-                            internal_id = 0
-
-                        if internal_id > max_internal_id:
-                            max_internal_id = internal_id
-
-                    next_internal_id = max_internal_id + 1
-
-                # New listing
-                new_listing = {
-                    "id": listing_id,
-                    "internal_id": next_internal_id,
-                    "title": listing_data.get("title", ""),
-                    "initial_price": current_price,
-                    "current_price": current_price,
-                    "year": listing_data.get("year"),
-                    "mileage": listing_data.get("mileage"),
-                    "url": listing_data.get("url", ""),
-                    "model": model,
-                    "first_seen": date_str,
-                    "last_seen": date_str,
-                    "first_scrape_timestamp": current_timestamp,
-                    "last_scrape_timestamp": current_timestamp,
-                    "price_readings": [[current_timestamp, current_price]],
-                    "price_change": 0,
-                    "active": True,
-                }
-                _carry_extra_fields(listing_data, new_listing)
-                updated_data.append(new_listing)
-                summary["new"].append(new_listing)
-                new_listings += 1
-                next_internal_id += 1  # Increment for next new listing
+                if new_id not in listings:
+                    # Calculate next internal ID if not done yet: one pass over the
+                    # stored listings per call, then a running counter
+                    if next_internal_id is None:
+                        next_internal_id = (
+                            max(map(_internal_id_of, listings.values()), default=0) + 1
+                        )
+
+                    # New listing
+                    new_listing = {
+                        "id": new_id,
+                        "internal_id": next_internal_id,
+                        "title": listing_data.get("title", ""),
+                        "initial_price": current_price,
+                        "current_price": current_price,
+                        "year": listing_data.get("year"),
+                        "mileage": listing_data.get("mileage"),
+                        "url": listing_data.get("url", ""),
+                        "model": model,
+                        "first_seen": date_str,
+                        "last_seen": date_str,
+                        "first_scrape_timestamp": current_timestamp,
+                        "last_scrape_timestamp": current_timestamp,
+                        "price_readings": [[current_timestamp, current_price]],
+                        "price_change": 0,
+                        "active": True,
+                    }
+                    _carry_extra_fields(listing_data, new_listing)
+                    listings[new_id] = new_listing
+                    summary["new"].append(new_listing)
+                    new_listings += 1
+                    next_internal_id += 1  # Increment for next new listing
+        except Exception:
+            self._file_cache.pop(data_file, None)
+            raise
 
         # Save updated data in new format
         try:
-            # Convert list to dictionary keyed by listing id
-            listings_dict = {}
-            for listing in updated_data:
-                listings_dict[listing["id"]] = listing
-
             # Create new format structure
             new_format_data = {
                 "metadata": {
                     "last_updated": datetime.now().isoformat(),
-                    "total_listings": len(updated_data),
+                    "total_listings": len(listings),
                     "model": model,
                 },
-                "listings": listings_dict,
+                "listings": listings,
             }
 
-            with open(data_file, "w", encoding="utf-8") as f:
-                json.dump(new_format_data, f, indent=2, ensure_ascii=False, default=str)
+            self._write_model_file(data_file, new_format_data)
 
             logger.info(
-                f"Updated data for {model}: {len(updated_data)} total listings, {new_listings} new, {price_changes} price changes"
+                f"Updated data for {model}: {len(listings)} total listings, {new_listings} new, {price_changes} price changes"
             )
             click.echo(
-                f"Updated data for {model}: {len(updated_data)} total listings, {new_listings} new, {price_changes} price changes"
+                f"Updated data for {model}: {len(listings)} total listings, {new_listings} new, {price_changes} price changes"
             )
             click.echo(f"Data saved to {data_file}")
 
         except Exception as e:
+            # Cached listings were mutated in place but never saved.
+            self._file_cache.pop(data_file, None)
             logger.error(f"Error saving data: {e}")
             click.echo(f"Error saving data: {e}")
 
-        summary["total"] = len(updated_data)
+        summary["total"] = len(listings)
         summary["price_changes"] = price_changes
         return summary
 
+    @staticmethod
+    def _flatten_listings(data: dict, model: str) -> dict[str, list]:
+        """
+        Flatten a parsed model file into one row per price reading
+
+        Rows are accumulated column-wise (one list per column) rather than as
+        a dict per row, which keeps memory flat and lets ``pd.DataFrame`` take
+        the columns as-is.
+
+        Args:
+            data: Parsed model file
+            model: Model name used when a listing does not carry one
+
+        Returns:
+            Column name -> values, for the columns of ``get_historical_data``
+        """
+        columns: dict[str, list] = {name: [] for name in HISTORY_COLUMNS}
+        ids, internal_ids, titles, prices, years, mileages, urls, models, dates, tss = (
+            columns.values()
+        )
+
+        # The latest data point, then every earlier price reading
+        # (the last reading is the current price, already in the first row)
+        for listing in data.get("listings", {}).values():
+            price_readings = listing.get("price_readings", [])
+            history = price_readings[:-1]
+            n_rows = 1 + len(history)
+
+            ids.extend([listing["id"]] * n_rows)
+            # Use internal_id if exists, otherwise 0
+            internal_ids.extend([listing.get("internal_id", 0)] * n_rows)
+            titles.extend([listing["title"]] * n_rows)
+            years.extend([listing["year"]] * n_rows)
+            mileages.extend([listing["mileage"]] * n_rows)
+            urls.extend([listing["url"]] * n_rows)
+            models.extend([listing["model"]] * n_rows)
+
+            prices.append(listing["current_price"])
+            dates.append(listing["last_seen"])
+            tss.append(listing["last_scrape_timestamp"])
+            if history:
+                # Transpose [[ts, price], ...] once and extend whole columns
+                history_ts, history_prices = zip(*history, strict=True)
+                prices.extend(history_prices)
+                tss.extend(history_ts)
+                dates.extend(map(_reading_date, history_ts))
+
+        return columns
+
     def get_historical_data(self, model: str | None = None) -> pd.DataFrame:
         """
         Get historical data for plotting and analysis
@@ -320,106 +627,45 @@ class SimplifiedListingsStorage:
                 raise FileNotFoundError(f"No data found for model: {model}")
 
             try:
-                with open(data_file, encoding="utf-8") as f:
-                    data = json.load(f)
+                data = self._read_model_file(data_file)
 
                 if not data:
                     raise ValueError(f"No data found for model: {model}")
 
-                # Handle both old format (list) and new format (dict with 'listings' key)
-                if isinstance(data, list):
-                    # Old format - convert to DataFrame directly
-                    flattened_data = []
-                    for listing in data:
-                        entry = {
-                            "id": listing.get("id"),
-                            "internal_id": listing.get("internal_id", 0),
-                            "title": listing.get("title", ""),
-                            "price": listing.get("price"),
-                            "year": listing.get("year"),
-                            "mileage": listing.get("mileage"),
-                            "url": listing.get("url", ""),
-                            "model": listing.get("model", model),
-                            "date": listing.get("scrape_date", "").split("T")[0]
-                            if "scrape_date" in listing
-                            else "",
-                            "scrape_timestamp": listing.get("scrape_timestamp", 0),
-                        }
-                        flattened_data.append(entry)
-                    return pd.DataFrame(flattened_data)
-                else:
-                    # New format - process listings with price history
-                    flattened_data = []
-                    listings = data.get("listings", {})
-
-                    for listing in listings.values():
-                        # Add the current entry (latest data point)
-                        main_entry = {
-                            "id": listing["id"],
-                            "internal_id": listing.get(
-                                "internal_id", 0
-                            ),  # Use internal_id if exists, otherwise 0
-                            "title": listing["title"],
-                            "price": listing["current_price"],
-                            "year": listing["year"],
-                            "mileage": listing["mileage"],
-                            "url": listing["url"],
-                            "model": listing["model"],
-                            "date": listing["last_seen"],
-                            "scrape_timestamp": listing["last_scrape_timestamp"],
-                        }
-                        flattened_data.append(main_entry)
-
-                        # Add historical price readings
-                        price_readings = listing.get("price_readings", [])
-                        if (
-                            len(price_readings) > 1
-                        ):  # More than just the initial reading
-                            for timestamp, price in price_readings[
-                                :-1
-                            ]:  # Exclude the last one (already added as main_entry)
-                                history_entry = main_entry.copy()
-                                history_entry.update(
-                                    {
-                                        "price": price,
-                                        "date": datetime.fromtimestamp(
-                                            timestamp
-                                        ).strftime("%Y-%m-%d"),
-                                        "scrape_timestamp": timestamp,
-                                    }
-                                )
-                                flattened_data.append(history_entry)
-
-                    return pd.DataFrame(flattened_data)
+                return _history_frame(self._flatten_listings(data, model))
 
             except Exception as e:
                 logger.error(f"Error loading data for model {model}: {e}")
                 raise ValueError(f"Error loading data for model {model}: {e}") from e
         else:
             # Get data for all models
-            all_data = []
-            model_dirs = [
-                d
-                for d in self.data_dir.iterdir()
-                if d.is_dir() and not d.name.startswith(".") and d.name not in ["plots"]
-            ]
+            data_files = [d / f"{d.name}.json" for d in self._model_dirs()]
+            data_files = [f for f in data_files if f.exists()]
+            if not data_files:
+                raise FileNotFoundError("No data found")
 
-            for model_dir in model_dirs:
-                model_name = model_dir.name
-                data_file = model_dir / f"{model_name}.json"
-                if data_file.exists():
-                    try:
-                        with open(data_file, encoding="utf-8") as f:
-                            model_data = json.load(f)
-                            all_data.extend(model_data)
-                    except Exception as e:
-                        logger.warning(f"Error loading data from {data_file}: {e}")
-                        continue
-
-            if not all_data:
+            def load_columns(data_file: Path) -> dict[str, list] | None:
+                try:
+                    data = self._read_model_file(data_file)
+                    return self._flatten_listings(data, data_file.stem)
+                except Exception as e:
+                    logger.warning(f"Error loading data from {data_file}: {e}")
+                    return None
+
+            # Model files are independent; overlap their reads across threads.
+            # Each model's columns are appended as soon as it is yielded, so
+            # its intermediate lists can be freed before the next one arrives.
+            all_data: dict[str, list] = {name: [] for name in HISTORY_COLUMNS}
+            with ThreadPoolExecutor(max_workers=min(32, len(data_files))) as pool:
+                for columns in pool.map(load_columns, data_files):
+                    if columns:
+                        for name, values in columns.items():
+                            all_data[name].extend(values)
+
+            if not all_data["id"]:
                 raise FileNotFoundError("No data found")
 
-            return pd.DataFrame(all_data)
+            return _history_frame(all_data)
 
     def get_summary_stats(self, model: str | None = None) -> dict:
         """
@@ -437,22 +683,24 @@ class SimplifiedListingsStorage:
                 return {"error": f"No data found for model: {model}"}
 
             try:
-                with open(data_file, encoding="utf-8") as f:
-                    data = json.load(f)
-
-                total_listings = len(data)
-                price_changes = len(
-                    [
-                        listing
-                        for listing in data
-                        if len(listing.get("price_readings", [])) > 1
-                    ]
+                data = self._read_model_file(data_file)
+                listings = list(data.get("listings", {}).values())
+                total_listings = len(listings)
+
+                # Pull the two per-listing numbers into arrays once and
+                # aggregate them vectorized
+                reading_counts = np.fromiter(
+                    (len(listing.get("price_readings") or ()) for listing in listings),
+                    dtype=np.int64,
+                    count=total_listings,
                 )
-                avg_price = (
-                    sum(listing["current_price"] for listing in data) / total_listings
-                    if total_listings > 0
-                    else 0
+                current_prices = np.fromiter(
+                    (listing.get("current_price") or 0 for listing in listings),
+                    dtype=np.float64,
+                    count=total_listings,
                 )
+                price_changes = int((reading_counts > 1).sum())
+                avg_price = float(current_prices.mean()) if total_listings > 0 else 0
 
                 return {
                     "model": model,
@@ -465,20 +713,19 @@ class SimplifiedListingsStorage:
             except Exception as e:
                 return {"error": f"Error loading data for model {model}: {e}"}
         else:
-            # Get stats for all models
-            stats = {}
-            model_dirs = [
-                d
-                for d in self.data_dir.iterdir()
-                if d.is_dir() and not d.name.startswith(".") and d.name not in ["plots"]
-            ]
-
-            for model_dir in model_dirs:
-                model_name = model_dir.name
-                model_stats = self.get_summary_stats(model_name)
-                stats[model_name] = model_stats
-
-            return stats
+            # Get stats for all models, loading the model files concurrently
+            model_names = [model_dir.name for model_dir in self._model_dirs()]
+            if not model_names:
+                return {}
+
+            with ThreadPoolExecutor(max_workers=min(32, len(model_names))) as pool:
+                return dict(
+                    zip(
+                        model_names,
+                        pool.map(self.get_summary_stats, model_names),
+                        strict=True,
+                    )
+                )
 
     def simulate_price_changes(self, model: str, change_count: int = 5) -> None:
         """
@@ -497,47 +744,58 @@ class SimplifiedListingsStorage:
             return
 
         try:
-            with open(data_file, encoding="utf-8") as f:
-                data = json.load(f)
-
-            if len(data) < change_count:
-                change_count = len(data)
+            data = self._read_model_file(data_file)
+            # Only listings with a known price can get a new one
+            listings = [
+                listing
+                for listing in data.get("listings", {}).values()
+                if (listing.get("current_price") or 0) > 0
+            ]
 
-            # Simulate price changes for random listings
-            import random
+            change_count = min(change_count, len(listings))
+
+            # Only rewrite the file if something actually changes
+            if change_count <= 0:
+                logger.info(f"No listings with a price to change in model: {model}")
+                return
+
+            # Simulate price changes for random listings: pick them and draw
+            # every change (-20% to +15%) in one vectorized pass
+            rng = np.random.default_rng()
+            picks = rng.choice(len(listings), size=change_count, replace=False)
+            selected_listings = [listings[i] for i in picks.tolist()]
+            current_prices = np.array(
+                [listing["current_price"] for listing in selected_listings],
+                dtype=np.float64,
+            )
+            new_prices = (
+                current_prices * (1 + rng.uniform(-0.20, 0.15, size=change_count))
+            ).astype(np.int64)
 
-            selected_listings = random.sample(data, change_count)
             current_timestamp = int(time.time())
             current_date = datetime.now().strftime("%Y-%m-%d")
 
-            for listing in selected_listings:
-                current_price = listing.get("current_price", 0)
-                if current_price > 0:
-                    # Random price change between -20% and +15%
-                    change_percent = random.uniform(-0.20, 0.15)
-                    new_price = int(current_price * (1 + change_percent))
-                    price_change = new_price - current_price
-
-                    # Update listing
-                    if "price_readings" not in listing:
-                        listing["price_readings"] = [
-                            [
-                                listing.get(
-                                    "first_scrape_timestamp", current_timestamp
-                                ),
-                                listing.get("initial_price", current_price),
-                            ]
+            for listing, new_price in zip(
+                selected_listings, new_prices.tolist(), strict=True
+            ):
+                current_price = listing["current_price"]
+
+                # Update listing
+                if "price_readings" not in listing:
+                    listing["price_readings"] = [
+                        [
+                            listing.get("first_scrape_timestamp", current_timestamp),
+                            listing.get("initial_price", current_price),
                         ]
+                    ]
 
-                    listing["price_readings"].append([current_timestamp, new_price])
-                    listing["current_price"] = new_price
-                    listing["price_change"] = price_change
-                    listing["last_seen"] = current_date
-                    listing["last_scrape_timestamp"] = current_timestamp
+                listing["price_readings"].append([current_timestamp, new_price])
+                listing["current_price"] = new_price
+                listing["price_change"] = new_price - current_price
+                listing["last_seen"] = current_date
+                listing["last_scrape_timestamp"] = current_timestamp
 
-            # Save updated data
-            with open(data_file, "w", encoding="utf-8") as f:
-                json.dump(data, f, indent=2, ensure_ascii=False, default=str)
+            self._write_model_file(data_file, data)
 
             logger.info(
                 f"Simulated price changes for {change_count} listings in model: {model}"
@@ -547,5 +805,7 @@ class SimplifiedListingsStorage:
             )
 
         except Exception as e:
+            # The cached parse may have been mutated without being saved.
+            self._file_cache.pop(data_file, None)
             logger.error(f"Error simulating price changes for {model}: {e}")
             click.echo(f"Error simulating price changes for {model}: {e}")
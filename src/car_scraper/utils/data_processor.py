@@ -1,13 +1,328 @@
 """Data processing utilities"""
 
-import json
+import csv
+import importlib.util
+import os
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import suppress
+from datetime import datetime
+from operator import attrgetter
 from pathlib import Path
+from typing import Any
 
 import click
+import numpy as np
 import pandas as pd
 
+from src.car_scraper.utils.fileio import atomic_write, read_json, write_json
 from src.car_scraper.utils.logger import logger
 
+try:
+    from pyarrow import csv as pa_csv
+except ImportError:  # pragma: no cover - optional speed-up
+    pa_csv = None
+
+# Above this size CSV rows are counted by newlines rather than by parsing.
+_CSV_COUNT_PARSE_LIMIT = 8 * 1024 * 1024
+
+
+def _count_csv_rows(path: Path, size: int) -> int:
+    """
+    Count the data rows of a CSV file
+
+    Large files are counted by scanning newlines in 1 MiB blocks instead of
+    parsing them. That assumes no quoted field spans lines, so small files,
+    where parsing is cheap, are still parsed: into an Arrow table when
+    pyarrow is installed (no DataFrame conversion needed for a count),
+    otherwise with pandas.
+
+    Args:
+        path: CSV file with a header row
+        size: File size in bytes, as already known by the caller
+
+    Returns:
+        Number of rows excluding the header
+    """
+    if size <= _CSV_COUNT_PARSE_LIMIT:
+        if pa_csv is not None:
+            return pa_csv.read_csv(path).num_rows
+        return len(pd.read_csv(path))
+    newlines = 0
+    last = b""
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            newlines += block.count(b"\n")
+            last = block
+    lines = newlines + (not last.endswith(b"\n"))
+    return max(lines - 1, 0)
+
+
+def _read_csv_records(path: Path) -> list[dict]:
+    """Read a CSV file into a list of row dicts, keeping values as written."""
+    with open(path, newline="", encoding="utf-8") as f:
+        return list(csv.DictReader(f))
+
+
+def _write_csv_records(path: Path, records: list[dict]) -> None:
+    """Atomically write row dicts (as read by ``_read_csv_records``) as CSV."""
+    with atomic_write(path) as tmp, open(tmp, "w", newline="", encoding="utf-8") as f:
+        writer = csv.DictWriter(f, fieldnames=list(records[0]), lineterminator="\n")
+        writer.writeheader()
+        writer.writerows(records)
+
+
+def _scan(path: Path) -> Iterator[os.DirEntry]:
+    """
+    Yield the entries of a directory
+
+    ``DirEntry.is_dir()``/``is_file()`` come from the directory read itself and
+    ``stat()`` is cached on the entry, so walking with this costs far fewer
+    syscalls than ``Path.glob``/``iterdir`` plus per-path predicates.
+
+    Args:
+        path: Directory to list
+
+    Yields:
+        One ``os.DirEntry`` per entry in ``path``
+    """
+    with os.scandir(path) as it:
+        yield from it
+
+
+# Derived JSON (exports, time_series/historical.json) is indented by default;
+# CS_COMPACT_JSON=1 writes it compact (smaller and faster to write and parse).
+# Model files always stay indented so their daily git diffs stay line-based.
+_COMPACT_JSON = os.environ.get("CS_COMPACT_JSON") == "1"
+
+
+def _write_derived_json(path: Path, data: Any) -> None:
+    """Atomically write derived JSON, compact only if ``CS_COMPACT_JSON=1``."""
+    write_json(path, data, pretty=not _COMPACT_JSON)
+
+
+def _write_json_frame(path: Path, df: pd.DataFrame) -> None:
+    """
+    Write ``df`` to ``path`` as a JSON list of records
+
+    Goes through ``write_json`` (orjson when installed, atomic replace) rather
+    than ``DataFrame.to_json``. Missing values become ``null``. Indented unless
+    ``CS_COMPACT_JSON=1`` is set (see ``_write_derived_json``).
+
+    Args:
+        path: Destination file
+        df: Frame to export
+    """
+    records = df.astype(object).where(df.notna(), None).to_dict("records")
+    _write_derived_json(path, records)
+
+
+# Optional writer needed by each export format, from the 'export' extra
+# (``poetry install --extras export``). Excel also works with openpyxl.
+_EXPORT_DEPENDENCIES = {"parquet": ("pyarrow",), "excel": ("xlsxwriter", "openpyxl")}
+
+
+def _check_export_dependencies(format: str) -> None:
+    """
+    Fail early if ``format`` needs an optional package that is not installed
+
+    Args:
+        format: Export format passed to ``DataProcessor.export_data``
+
+    Raises:
+        ImportError: None of the packages that can write ``format`` is installed
+    """
+    packages = _EXPORT_DEPENDENCIES.get(format, ())
+    if packages and not any(importlib.util.find_spec(name) for name in packages):
+        raise ImportError(
+            f"'{format}' export needs {' or '.join(packages)}; install it with "
+            "`poetry install --extras export`"
+        )
+
+
+# xlsxwriter can stream rows to disk (constant_memory) instead of holding the
+# whole workbook in memory as openpyxl does; pandas picks its default otherwise.
+_EXCEL_ENGINE = "xlsxwriter" if importlib.util.find_spec("xlsxwriter") else None
+
+
+def _write_excel(path: Path, df: pd.DataFrame) -> None:
+    """Write ``df`` to an Excel workbook, streaming rows when xlsxwriter is present."""
+    if _EXCEL_ENGINE is None:
+        df.to_excel(path, index=False)
+        return
+    with pd.ExcelWriter(
+        path,
+        engine=_EXCEL_ENGINE,
+        engine_kwargs={"options": {"constant_memory": True}},
+    ) as writer:
+        df.to_excel(writer, index=False)
+
+
+def _dedup_records(records: list[dict]) -> list[dict]:
+    """
+    Keep the last record for each (model, date) pair
+
+    Same result and order as ``DataFrame.drop_duplicates(keep="last")``, but
+    done with one dict pass over the parsed records instead of building a frame.
+    Walking backwards makes the first assignment per key the one that stays.
+
+    Args:
+        records: Parsed time-series records
+
+    Returns:
+        Deduplicated records, in their original order
+    """
+    unique: dict[tuple, dict] = {}
+    for record in reversed(records):
+        unique.setdefault((record["model"], record["date"]), record)
+    return list(reversed(unique.values()))
+
+
+def _model_file_status(entry: os.DirEntry) -> dict:
+    """
+    Summarize one top-level JSON/CSV model file for ``get_data_status``
+
+    Args:
+        entry: Directory entry of the file
+
+    Returns:
+        Name, record count and size (or count 0 and an ``error`` entry)
+    """
+    try:
+        size = entry.stat().st_size
+        if entry.name.endswith(".json"):
+            count = len(read_json(Path(entry.path)))
+        else:
+            count = _count_csv_rows(Path(entry.path), size)
+        return {"name": entry.name, "count": count, "size": size}
+    except Exception as e:
+        return {"name": entry.name, "count": 0, "error": str(e)}
+
+
+# Per-file status summaries shared by all DataProcessor instances, keyed by
+# path and validated against the file's (mtime_ns, size); oldest evicted first.
+_LISTINGS_STATUS_CACHE: dict[Path, tuple[tuple[int, int], dict]] = {}
+_LISTINGS_STATUS_CACHE_SIZE = 256
+
+
+def _listings_status(model_file: Path) -> dict | None:
+    """
+    Summarize one model's listings file for ``get_data_status``
+
+    Summaries are cached per file, so a model file is only parsed again once
+    its mtime or size changes.
+
+    Args:
+        model_file: Path to ``<model>/<model>.json``
+
+    Returns:
+        Listing/reading counts, size and last update (or an ``error`` entry);
+        None if the file does not exist
+    """
+    # One stat both checks for the file and gives its size and stamp
+    try:
+        st = model_file.stat()
+    except FileNotFoundError:
+        return None
+    file_size = st.st_size
+    stamp = (st.st_mtime_ns, file_size)
+    cached = _LISTINGS_STATUS_CACHE.get(model_file)
+    if cached is not None and cached[0] == stamp:
+        return cached[1]
+    try:
+        data = read_json(model_file)
+
+        # Handle both old format (list) and new format (dict with 'listings' key)
+        if isinstance(data, list):
+            # Old format - just count the listings
+            total_listings = len(data)
+            price_readings = 0  # Old format doesn't have price readings
+            last_updated = "unknown (old format)"
+        else:
+            # New format
+            listings = data.get("listings", {})
+            total_listings = len(listings)
+            # Preallocated int array summed in C rather than a generator sum
+            price_readings = int(
+                np.fromiter(
+                    (
+                        len(listing.get("price_readings", ()))
+                        for listing in listings.values()
+                    ),
+                    dtype=np.int64,
+                    count=total_listings,
+                ).sum()
+            )
+            last_updated = data.get("metadata", {}).get("last_updated", "unknown")
+
+        info = {
+            "total_listings": total_listings,
+            "total_price_readings": price_readings,
+            "file_size": file_size,
+            "last_updated": last_updated,
+        }
+    except Exception as e:
+        return {"error": str(e)}
+
+    if len(_LISTINGS_STATUS_CACHE) >= _LISTINGS_STATUS_CACHE_SIZE:
+        _LISTINGS_STATUS_CACHE.pop(next(iter(_LISTINGS_STATUS_CACHE)), None)
+    _LISTINGS_STATUS_CACHE[model_file] = (stamp, info)
+    return info
+
+
+def _dedup_price_readings(model_file: Path) -> tuple[Any, int]:
+    """
+    Load a model file and drop same-day duplicate price readings in memory
+
+    Args:
+        model_file: Path to ``<model>/<model>.json``
+
+    Returns:
+        The parsed (and cleaned) file contents and the number of readings removed
+    """
+    data = read_json(model_file)
+
+    # Clean duplicate price readings for each listing
+    cleaned_count = 0
+    for listing in data.get("listings", {}).values():
+        price_readings = listing.get("price_readings", [])
+        # A single reading cannot have a duplicate
+        if len(price_readings) < 2:
+            continue
+
+        # Readings are [timestamp, price]; keep the last one of each (local)
+        # day so the final reading still matches current_price after a
+        # same-day price change.
+        unique: dict = {}
+        for reading in price_readings:
+            unique[datetime.fromtimestamp(reading[0]).date()] = reading
+        if len(unique) == len(price_readings):
+            continue
+        cleaned_count += len(price_readings) - len(unique)
+        readings = list(unique.values())
+        listing["price_readings"] = readings
+        # Derived prices must describe the readings that are left
+        listing["initial_price"] = readings[0][1]
+        listing["current_price"] = readings[-1][1]
+        price_change = 0
+        for prev, cur in zip(readings, readings[1:], strict=False):
+            if cur[1] != prev[1]:
+                price_change = cur[1] - prev[1]
+        listing["price_change"] = price_change
+
+    return data, cleaned_count
+
+
+# Record reader/writer pair per time-series file extension.
+_TIME_SERIES_IO = {
+    "csv": (_read_csv_records, _write_csv_records),
+    "json": (read_json, _write_derived_json),
+}
+
+
+# data_dir subdirectories whose individual files get_data_status reports.
+_STATUS_FILE_DIRS = ("time_series", "plots")
+
 
 class DataProcessor:
     """Utility class for data processing operations"""
@@ -20,6 +335,34 @@ class DataProcessor:
             data_dir: Base data directory
         """
         self.data_dir = Path(data_dir)
+        # Last status and the on-disk signature it was computed from
+        self._status_cache: tuple[tuple, dict] | None = None
+
+    def _status_signature(self) -> tuple:
+        """
+        Fingerprint everything ``get_data_status`` reads
+
+        Every top-level entry's name, mtime and size, each model dir's
+        ``<model>.json``, and every file in ``time_series/`` and ``plots/``.
+        Those files are listed individually because rewriting one in place
+        does not touch its directory's mtime.
+
+        Returns:
+            Tuple that changes whenever the reported status could change
+        """
+        signature: list[tuple] = []
+        for entry in sorted(_scan(self.data_dir), key=attrgetter("name")):
+            st = entry.stat()
+            signature.append((entry.name, st.st_mtime_ns, st.st_size))
+            if entry.is_dir() and entry.name in _STATUS_FILE_DIRS:
+                for sub in sorted(_scan(Path(entry.path)), key=attrgetter("name")):
+                    sub_st = sub.stat()
+                    signature.append((sub.name, sub_st.st_mtime_ns, sub_st.st_size))
+            elif entry.is_dir():
+                with suppress(FileNotFoundError):
+                    st = os.stat(os.path.join(entry.path, f"{entry.name}.json"))
+                    signature.append((st.st_mtime_ns, st.st_size))
+        return tuple(signature)
 
     def get_data_status(self) -> dict:
         """
@@ -38,88 +381,53 @@ class DataProcessor:
         if not self.data_dir.exists():
             return status
 
-        # Model files
-        model_files = list(self.data_dir.glob("*.json")) + list(
-            self.data_dir.glob("*.csv")
-        )
-        for file_path in model_files:
-            try:
-                if file_path.suffix == ".json":
-                    with open(file_path) as f:
-                        data = json.load(f)
-                    count = len(data)
-                else:
-                    df = pd.read_csv(file_path)
-                    count = len(df)
-
-                status["model_files"].append(
-                    {
-                        "name": file_path.name,
-                        "count": count,
-                        "size": file_path.stat().st_size,
-                    }
-                )
-            except Exception as e:
-                status["model_files"].append(
-                    {"name": file_path.name, "count": 0, "error": str(e)}
-                )
+        # Nothing changed on disk since the last call: reuse its result
+        signature = self._status_signature()
+        if self._status_cache is not None and self._status_cache[0] == signature:
+            return self._status_cache[1]
+
+        # One pass over the data dir: top-level model files and per-model dirs
+        model_files = []
+        model_dirs = []
+        for entry in _scan(self.data_dir):
+            if entry.is_dir():
+                if not entry.name.startswith("."):
+                    model_dirs.append(entry)
+            elif entry.name.endswith((".json", ".csv")) and entry.is_file():
+                model_files.append(entry)
 
         # Time series data
         time_series_dir = self.data_dir / "time_series"
         if time_series_dir.exists():
-            time_series_files = list(time_series_dir.glob("*.json")) + list(
-                time_series_dir.glob("*.csv")
-            )
-            for file_path in time_series_files:
-                status["time_series_files"].append(
-                    {"name": file_path.name, "size": file_path.stat().st_size}
-                )
+            for entry in _scan(time_series_dir):
+                if entry.name.endswith((".json", ".csv")) and entry.is_file():
+                    status["time_series_files"].append(
+                        {"name": entry.name, "size": entry.stat().st_size}
+                    )
 
-        # Simplified listings data (new format)
-        for model_dir in self.data_dir.iterdir():
-            if model_dir.is_dir() and not model_dir.name.startswith("."):
-                model_file = model_dir / f"{model_dir.name}.json"
-                if model_file.exists():
-                    try:
-                        with open(model_file) as f:
-                            data = json.load(f)
-
-                        # Handle both old format (list) and new format (dict with 'listings' key)
-                        if isinstance(data, list):
-                            # Old format - just count the listings
-                            total_listings = len(data)
-                            price_readings = 0  # Old format doesn't have price readings
-                            last_updated = "unknown (old format)"
-                        else:
-                            # New format
-                            total_listings = len(data.get("listings", {}))
-                            price_readings = sum(
-                                len(listing.get("price_readings", []))
-                                for listing in data.get("listings", {}).values()
-                            )
-                            last_updated = data.get("metadata", {}).get(
-                                "last_updated", "unknown"
-                            )
+        # Top-level model files and simplified listings (new format) are
+        # independent files, so they are read and summarized concurrently;
+        # map() keeps the results in directory order
+        listings_files = [Path(d.path) / f"{d.name}.json" for d in model_dirs]
+        with ThreadPoolExecutor() as pool:
+            model_file_infos = pool.map(_model_file_status, model_files)
+            listings_infos = pool.map(_listings_status, listings_files)
 
-                        status["simplified_listings"][model_dir.name] = {
-                            "total_listings": total_listings,
-                            "total_price_readings": price_readings,
-                            "file_size": model_file.stat().st_size,
-                            "last_updated": last_updated,
-                        }
-                    except Exception as e:
-                        status["simplified_listings"][model_dir.name] = {
-                            "error": str(e)
-                        }
+            status["model_files"] = list(model_file_infos)
+            for model_dir, info in zip(model_dirs, listings_infos, strict=True):
+                if info is not None:
+                    status["simplified_listings"][model_dir.name] = info
 
         # Plots
         plots_dir = self.data_dir / "plots"
         if plots_dir.exists():
-            plot_files = list(plots_dir.glob("*.png"))
             status["plots"] = [
-                {"name": f.name, "size": f.stat().st_size} for f in plot_files
+                {"name": entry.name, "size": entry.stat().st_size}
+                for entry in _scan(plots_dir)
+                if entry.name.endswith(".png") and entry.is_file()
             ]
 
+        self._status_cache = (signature, status)
         return status
 
     def print_status(self) -> None:
@@ -130,41 +438,48 @@ class DataProcessor:
             click.echo(f"Data directory {self.data_dir} does not exist.")
             return
 
+        # Build the report first and write it with one echo
+        lines = []
+
         # Model files
-        click.echo(f"Found {len(status['model_files'])} model data files:")
+        lines.append(f"Found {len(status['model_files'])} model data files:")
         for file_info in status["model_files"]:
             if "error" in file_info:
-                click.echo(
+                lines.append(
                     f"  {file_info['name']}: Error reading file ({file_info['error']})"
                 )
             else:
-                click.echo(f"  {file_info['name']}: {file_info['count']} records")
+                lines.append(f"  {file_info['name']}: {file_info['count']} records")
 
         # Time series data
         if status["time_series_files"]:
-            click.echo(f"\nFound {len(status['time_series_files'])} time series files:")
+            lines.append(
+                f"\nFound {len(status['time_series_files'])} time series files:"
+            )
             for file_info in status["time_series_files"]:
-                click.echo(f"  {file_info['name']}")
+                lines.append(f"  {file_info['name']}")
 
         # Simplified listings data
         if status["simplified_listings"]:
-            click.echo("\nSimplified listings data:")
+            lines.append("\nSimplified listings data:")
             for model, model_info in status["simplified_listings"].items():
                 if "error" not in model_info:
-                    click.echo(
+                    lines.append(
                         f"  {model}: {model_info['total_listings']} listings, "
                         f"{model_info['total_price_readings']} price readings, "
                         f"last updated: {model_info['last_updated']}"
                     )
                 else:
-                    click.echo(f"  {model}: Error - {model_info['error']}")
+                    lines.append(f"  {model}: Error - {model_info['error']}")
 
         # Plots
         if status["plots"]:
-            click.echo(f"\nFound {len(status['plots'])} generated plots:")
+            lines.append(f"\nFound {len(status['plots'])} generated plots:")
             for plot_info in status["plots"]:
                 size_kb = plot_info["size"] / 1024
-                click.echo(f"  {plot_info['name']} ({size_kb:.1f} KB)")
+                lines.append(f"  {plot_info['name']} ({size_kb:.1f} KB)")
+
+        click.echo("\n".join(lines))
 
     def clean_data(self, dry_run: bool = True) -> None:
         """
@@ -174,6 +489,7 @@ class DataProcessor:
             dry_run: If True, show what would be cleaned without actually doing it
         """
         logger.info(f"Cleaning data (dry_run={dry_run})")
+        self._status_cache = None
 
         # Clean simplified listings duplicates
         self._clean_simplified_listings(dry_run)
@@ -188,57 +504,38 @@ class DataProcessor:
 
     def _clean_simplified_listings(self, dry_run: bool) -> None:
         """Clean simplified listings data"""
-        for model_dir in self.data_dir.iterdir():
+        model_files = []
+        for model_dir in _scan(self.data_dir):
             if not model_dir.is_dir() or model_dir.name.startswith("."):
                 continue
 
-            model_file = model_dir / f"{model_dir.name}.json"
-            if not model_file.exists():
-                continue
-
-            try:
-                with open(model_file, encoding="utf-8") as f:
-                    data = json.load(f)
-
-                listings = data.get("listings", {})
-
-                # Clean duplicate price readings for each listing
-                cleaned_count = 0
-                for listing_id, listing in listings.items():
-                    price_readings = listing.get("price_readings", [])
-                    if not price_readings:
-                        continue
-
-                    # Remove duplicate readings based on date
-                    seen_dates = set()
-                    clean_readings = []
-                    for reading in price_readings:
-                        date = reading.get("date")
-                        if date not in seen_dates:
-                            clean_readings.append(reading)
-                            seen_dates.add(date)
+            model_file = Path(model_dir.path) / f"{model_dir.name}.json"
+            if model_file.exists():
+                model_files.append(model_file)
+
+        # Parse and dedup the models concurrently; report and write in order
+        with ThreadPoolExecutor() as pool:
+            futures = [pool.submit(_dedup_price_readings, f) for f in model_files]
+            for model_file, future in zip(model_files, futures, strict=True):
+                try:
+                    data, cleaned_count = future.result()
+
+                    if cleaned_count > 0:
+                        if dry_run:
+                            click.echo(
+                                f"Would remove {cleaned_count} duplicate price readings from {model_file.name}"
+                            )
                         else:
-                            cleaned_count += 1
-
-                    listings[listing_id]["price_readings"] = clean_readings
-
-                if cleaned_count > 0:
-                    if dry_run:
-                        click.echo(
-                            f"Would remove {cleaned_count} duplicate price readings from {model_file.name}"
-                        )
+                            write_json(model_file, data)
+                            click.echo(
+                                f"Removed {cleaned_count} duplicate price readings from {model_file.name}"
+                            )
                     else:
-                        with open(model_file, "w", encoding="utf-8") as f:
-                            json.dump(data, f, indent=2, ensure_ascii=False)
-                        click.echo(
-                            f"Removed {cleaned_count} duplicate price readings from {model_file.name}"
-                        )
-                else:
-                    click.echo(f"No duplicates found in {model_file.name}")
+                        click.echo(f"No duplicates found in {model_file.name}")
 
-            except Exception as e:
-                logger.error(f"Error cleaning {model_file}: {str(e)}")
-                click.echo(f"Error cleaning {model_file}: {str(e)}")
+                except Exception as e:
+                    logger.error(f"Error cleaning {model_file}: {str(e)}")
+                    click.echo(f"Error cleaning {model_file}: {str(e)}")
 
     def _clean_time_series(self, dry_run: bool) -> None:
         """Clean time series data"""
@@ -247,24 +544,19 @@ class DataProcessor:
             return
 
         # Clean historical files
-        for ext in ["csv", "json"]:
+        for ext, (read_rows, write_rows) in _TIME_SERIES_IO.items():
             historical_file = time_series_dir / f"historical.{ext}"
             if not historical_file.exists():
                 continue
 
             try:
-                if ext == "json":
-                    with open(historical_file, encoding="utf-8") as f:
-                        data = json.load(f)
-                    df = pd.DataFrame(data)
-                else:
-                    df = pd.read_csv(historical_file)
+                rows = read_rows(historical_file)
 
-                original_count = len(df)
+                original_count = len(rows)
 
                 # Remove duplicates based on model and date
-                df_clean = df.drop_duplicates(subset=["model", "date"], keep="last")
-                removed_count = original_count - len(df_clean)
+                clean_rows = _dedup_records(rows)
+                removed_count = original_count - len(clean_rows)
 
                 if removed_count > 0:
                     if dry_run:
@@ -272,16 +564,7 @@ class DataProcessor:
                             f"Would remove {removed_count} duplicate entries from {historical_file.name}"
                         )
                     else:
-                        if ext == "json":
-                            with open(historical_file, "w", encoding="utf-8") as f:
-                                json.dump(
-                                    df_clean.to_dict("records"),
-                                    f,
-                                    indent=2,
-                                    ensure_ascii=False,
-                                )
-                        else:
-                            df_clean.to_csv(historical_file, index=False)
+                        write_rows(historical_file, clean_rows)
                         click.echo(
                             f"Removed {removed_count} duplicate entries from {historical_file.name}"
                         )
@@ -297,32 +580,56 @@ class DataProcessor:
         Export data in specified format
 
         Args:
-            format: Export format ('csv', 'json', 'excel')
+            format: Export format ('csv', 'json', 'jsonl', 'parquet', 'excel');
+                'jsonl' writes one record per line so the file can be read
+                back line by line instead of as one large array; 'parquet'
+                (needs pyarrow) is typed, compressed and column-selectable;
+                'parquet' and 'excel' need the 'export' extra
             model: Optional model filter
+
+        Raises:
+            ImportError: ``format`` needs an optional package that is missing
         """
+        _check_export_dependencies(format)
         logger.info(f"Exporting data in {format} format for model: {model}")
 
         # Create exports directory
         exports_dir = self.data_dir / "exports"
         exports_dir.mkdir(exist_ok=True)
 
+        # Both exports start from the same history; build it once
+        try:
+            df = self._load_history(model)
+        except Exception as e:
+            logger.error(f"Error loading data to export: {str(e)}")
+            return
+
         # Export individual listings data
-        self._export_individual_listings(exports_dir, format, model)
+        self._export_individual_listings(exports_dir, format, model, df)
 
         # Export aggregated data
-        self._export_aggregated_data(exports_dir, format, model)
+        self._export_aggregated_data(exports_dir, format, model, df)
 
         click.echo(f"Data exported to {exports_dir}")
 
+    def _load_history(self, model: str | None) -> pd.DataFrame:
+        """Load the per-reading history of ``model`` (or all models)"""
+        from ..storage.simplified_listings import SimplifiedListingsStorage
+
+        storage = SimplifiedListingsStorage(str(self.data_dir))
+        return storage.get_historical_data(model)
+
     def _export_individual_listings(
-        self, exports_dir: Path, format: str, model: str | None
+        self,
+        exports_dir: Path,
+        format: str,
+        model: str | None,
+        df: pd.DataFrame | None = None,
     ) -> None:
         """Export individual listings data from simplified storage"""
         try:
-            from ..storage.simplified_listings import SimplifiedListingsStorage
-
-            storage = SimplifiedListingsStorage(str(self.data_dir))
-            df = storage.get_historical_data(model)
+            if df is None:
+                df = self._load_history(model)
 
             if len(df) == 0:
                 click.echo("No data found to export")
@@ -334,9 +641,13 @@ class DataProcessor:
             if format == "csv":
                 df.to_csv(output_file, index=False)
             elif format == "json":
-                df.to_json(output_file, orient="records", indent=2)
+                _write_json_frame(output_file, df)
+            elif format == "jsonl":
+                df.to_json(output_file, orient="records", lines=True)
+            elif format == "parquet":
+                df.to_parquet(output_file, index=False, compression="zstd")
             elif format == "excel":
-                df.to_excel(output_file, index=False)
+                _write_excel(output_file, df)
 
             click.echo(f"Exported individual listings to {filename}")
 
@@ -344,14 +655,16 @@ class DataProcessor:
             logger.error(f"Error exporting individual listings: {str(e)}")
 
     def _export_aggregated_data(
-        self, exports_dir: Path, format: str, model: str | None
+        self,
+        exports_dir: Path,
+        format: str,
+        model: str | None,
+        df: pd.DataFrame | None = None,
     ) -> None:
         """Export aggregated statistical data"""
         try:
-            from ..storage.simplified_listings import SimplifiedListingsStorage
-
-            storage = SimplifiedListingsStorage(str(self.data_dir))
-            df = storage.get_historical_data(model)
+            if df is None:
+                df = self._load_history(model)
 
             # Create aggregated statistics
             stats = (
@@ -375,9 +688,13 @@ class DataProcessor:
             if format == "csv":
                 stats.to_csv(output_file, index=False)
             elif format == "json":
-                stats.to_json(output_file, orient="records", indent=2)
+                _write_json_frame(output_file, stats)
+            elif format == "jsonl":
+                stats.to_json(output_file, orient="records", lines=True)
+            elif format == "parquet":
+                stats.to_parquet(output_file, index=False, compression="zstd")
             elif format == "excel":
-                stats.to_excel(output_file, index=False)
+                _write_excel(output_file, stats)
 
             click.echo(f"Exported aggregated statistics to {filename}")
 
@@ -437,7 +754,7 @@ class DataProcessor:
                 return pd.DataFrame()
 
             # Export to JSON
-            df.to_json(output_file, orient="records", indent=2)
+            _write_json_frame(Path(output_file), df)
             logger.info(f"Exported {len(df)} records to {output_file}")
 
             return df
@@ -1,10 +1,21 @@
 """Logging configuration using loguru."""
 
 import sys
+from functools import cache
 from pathlib import Path
 
 from loguru import logger
 
+_CONSOLE_FORMAT = (
+    "<green>{time:YYYY-MM-DD HH:mm:ss}</green> | "
+    "<level>{level: <8}</level> | "
+    "<cyan>{name}</cyan>:<cyan>{function}</cyan>:<cyan>{line}</cyan> | "
+    "<level>{message}</level>"
+)
+_FILE_FORMAT = (
+    "{time:YYYY-MM-DD HH:mm:ss} | {level: <8} | {name}:{function}:{line} | {message}"
+)
+
 
 def setup_logger(
     log_level: str = "INFO",
@@ -23,15 +34,13 @@ def setup_logger(
     # Remove default logger
     logger.remove()
 
-    # Add console handler with colors
+    # Add console handler; colors only when stderr is a terminal (None lets
+    # loguru check that), so piped/CI output skips the ANSI markup pass
     logger.add(
         sys.stderr,
-        format="<green>{time:YYYY-MM-DD HH:mm:ss}</green> | "
-        "<level>{level: <8}</level> | "
-        "<cyan>{name}</cyan>:<cyan>{function}</cyan>:<cyan>{line}</cyan> | "
-        "<level>{message}</level>",
+        format=_CONSOLE_FORMAT,
         level=log_level,
-        colorize=True,
+        colorize=None,
     )
 
     # Add file handler if log_file is provided
@@ -39,12 +48,13 @@ def setup_logger(
         log_file.parent.mkdir(parents=True, exist_ok=True)
         logger.add(
             log_file,
-            format="{time:YYYY-MM-DD HH:mm:ss} | {level: <8} | "
-            "{name}:{function}:{line} | {message}",
+            format=_FILE_FORMAT,
             level=log_level,
             rotation=rotation,
             retention=retention,
             compression="zip",
+            # Write (and rotate) from a background thread, off the caller's path
+            enqueue=True,
         )
 
     logger.info(f"Logger initialized with level: {log_level}")
@@ -52,6 +62,7 @@ def setup_logger(
         logger.info(f"Logging to file: {log_file}")
 
 
+@cache
 def get_logger(name: str):
-    """Get a logger instance for a specific module."""
+    """Get a logger instance for a specific module (one bound logger per name)."""
     return logger.bind(name=name)
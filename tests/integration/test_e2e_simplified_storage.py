@@ -10,6 +10,7 @@ This test covers the complete workflow:
 6. Price change tracking over multiple scrape sessions
 """
 
+import importlib.util
 import json
 import shutil
 import tempfile
@@ -340,6 +341,23 @@ class TestE2ESimplifiedStorage(unittest.TestCase):
             df = pd.read_csv(csv_file)
             self.assertEqual(len(df), 3, "CSV should have 3 rows")
 
+            # Test JSON Lines export
+            processor._export_individual_listings(exports_dir, "jsonl", self.test_model)
+            jsonl_file = csv_file.with_suffix(".jsonl")
+            with open(jsonl_file, encoding="utf-8") as f:
+                rows = [json.loads(line) for line in f]
+            self.assertEqual(len(rows), 3, "JSONL should have one line per row")
+
+            # Test Parquet export (optional pyarrow dependency)
+            if importlib.util.find_spec("pyarrow"):
+                processor._export_individual_listings(
+                    exports_dir, "parquet", self.test_model
+                )
+                df = pd.read_parquet(
+                    csv_file.with_suffix(".parquet"), columns=["id", "price"]
+                )
+                self.assertEqual(len(df), 3, "Parquet should have 3 rows")
+
             print("✅ Export functionality test passed")
         except Exception as e:
             self.fail(f"Export functionality failed: {e}")
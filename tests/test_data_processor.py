@@ -0,0 +1,119 @@
+"""Tests for DataProcessor maintenance and export commands."""
+
+import json
+import tempfile
+from datetime import datetime
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from src.car_scraper.storage import SimplifiedListingsStorage
+from src.car_scraper.utils import data_processor
+from src.car_scraper.utils.data_processor import DataProcessor
+
+
+def test_clean_drops_same_day_price_readings():
+    """Only the last reading of each day survives a non-dry-run clean."""
+    data_dir = Path(tempfile.mkdtemp())
+    model_file = data_dir / "m" / "m.json"
+    model_file.parent.mkdir()
+    day1 = int(datetime(2025, 1, 1, 9).timestamp())
+    day2 = int(datetime(2025, 1, 2, 9).timestamp())
+    listing = {
+        "price_readings": [[day1, 100], [day1 + 3600, 120], [day2, 120]],
+        "initial_price": 100,
+        "current_price": 120,
+        "price_change": 20,
+    }
+    model_file.write_text(
+        json.dumps({"metadata": {}, "listings": {"a": listing}}), encoding="utf-8"
+    )
+
+    DataProcessor(str(data_dir)).clean_data(dry_run=False)
+
+    cleaned = json.loads(model_file.read_text(encoding="utf-8"))["listings"]["a"]
+    assert cleaned["price_readings"] == [[day1 + 3600, 120], [day2, 120]]
+    # Recomputed from the surviving readings: no change left within them
+    assert cleaned["initial_price"] == 120
+    assert cleaned["current_price"] == 120
+    assert cleaned["price_change"] == 0
+
+
+def test_clean_time_series_json_keeps_last_entry_per_model_and_date():
+    data_dir = Path(tempfile.mkdtemp())
+    historical = data_dir / "time_series" / "historical.json"
+    historical.parent.mkdir()
+    records = [
+        {"model": "a", "date": "2025-01-01", "avg_price": 1},
+        {"model": "b", "date": "2025-01-01", "avg_price": 2},
+        {"model": "a", "date": "2025-01-01", "avg_price": 3},
+        {"model": "a", "date": "2025-01-02", "avg_price": 4},
+    ]
+    historical.write_text(json.dumps(records), encoding="utf-8")
+
+    DataProcessor(str(data_dir)).clean_data(dry_run=False)
+
+    expected = pd.DataFrame(records).drop_duplicates(
+        subset=["model", "date"], keep="last"
+    )
+    assert json.loads(historical.read_text(encoding="utf-8")) == expected.to_dict(
+        "records"
+    )
+
+
+def test_status_reflects_writes_after_being_cached():
+    data_dir = Path(tempfile.mkdtemp())
+    storage = SimplifiedListingsStorage(str(data_dir))
+    processor = DataProcessor(str(data_dir))
+    storage.store_listings_data("m", [{"id": "a", "price": 1000}], "2025-01-01")
+    assert (
+        processor.get_data_status()["simplified_listings"]["m"]["total_listings"] == 1
+    )
+    assert processor.get_data_status() is processor.get_data_status()
+
+    listings = [{"id": "a", "price": 1000}, {"id": "b", "price": 2000}]
+    storage.store_listings_data("m", listings, "2025-01-02")
+    assert (
+        processor.get_data_status()["simplified_listings"]["m"]["total_listings"] == 2
+    )
+
+
+def test_status_sees_in_place_time_series_rewrite():
+    data_dir = Path(tempfile.mkdtemp())
+    historical = data_dir / "time_series" / "historical.json"
+    historical.parent.mkdir()
+    historical.write_text("[]", encoding="utf-8")
+    processor = DataProcessor(str(data_dir))
+    assert processor.get_data_status()["time_series_files"][0]["size"] == 2
+
+    # Rewriting an existing file leaves its directory's mtime unchanged
+    historical.write_text('[{"a": 1}]', encoding="utf-8")
+    assert processor.get_data_status()["time_series_files"][0]["size"] == 10
+
+
+def test_clean_time_series_csv_keeps_last_row_and_original_text():
+    data_dir = Path(tempfile.mkdtemp())
+    historical = data_dir / "time_series" / "historical.csv"
+    historical.parent.mkdir()
+    historical.write_text(
+        "model,date,avg_price\n"
+        "a,2025-01-01,1.50\n"
+        "b,2025-01-01,2.00\n"
+        "a,2025-01-01,3.50\n",
+        encoding="utf-8",
+    )
+
+    DataProcessor(str(data_dir)).clean_data(dry_run=False)
+
+    assert historical.read_text(encoding="utf-8") == (
+        "model,date,avg_price\nb,2025-01-01,2.00\na,2025-01-01,3.50\n"
+    )
+
+
+def test_parquet_export_without_pyarrow_fails_clearly(monkeypatch):
+    data_dir = Path(tempfile.mkdtemp())
+    monkeypatch.setattr(data_processor.importlib.util, "find_spec", lambda _: None)
+    with pytest.raises(ImportError, match="--extras export"):
+        DataProcessor(str(data_dir)).export_data(format="parquet")
+    assert not (data_dir / "exports").exists()
@@ -0,0 +1,64 @@
+"""Tests for the atomic file-writing helpers."""
+
+import json
+import tempfile
+from pathlib import Path
+
+import pytest
+
+from src.car_scraper.utils.fileio import read_json, write_json
+
+
+class _Unserializable:
+    def __str__(self):
+        raise RuntimeError("boom")
+
+
+def test_write_json_replaces_file():
+    path = Path(tempfile.mkdtemp()) / "m.json"
+    write_json(path, {"a": 1})
+    write_json(path, {"a": 2})
+    assert json.loads(path.read_text(encoding="utf-8")) == {"a": 2}
+    assert not path.with_suffix(".json.tmp").exists()
+
+
+def test_failed_write_keeps_previous_file():
+    """A crash mid-serialization must leave the old file intact."""
+    path = Path(tempfile.mkdtemp()) / "m.json"
+    write_json(path, {"a": 1})
+    # orjson wraps errors raised by ``default`` in its TypeError subclass.
+    with pytest.raises((RuntimeError, TypeError)):
+        write_json(path, {"a": _Unserializable()})
+    assert json.loads(path.read_text(encoding="utf-8")) == {"a": 1}
+    assert not path.with_suffix(".json.tmp").exists()
+
+
+def test_write_json_round_trips_non_ascii_and_indents():
+    path = Path(tempfile.mkdtemp()) / "m.json"
+    data = {"listings": {"a1": {"title": "Škoda Łódź", "price_readings": [[1, 2]]}}}
+    write_json(path, data)
+    text = path.read_text(encoding="utf-8")
+    assert "Škoda Łódź" in text
+    assert text.startswith('{\n  "listings"')
+    assert read_json(path) == data
+
+
+def test_read_json_empty_file_raises_value_error():
+    path = Path(tempfile.mkdtemp()) / "m.json"
+    path.write_bytes(b"")
+    with pytest.raises(ValueError):
+        read_json(path)
+
+
+def test_compact_and_gzip_round_trip():
+    data = {"listings": {"a1": {"price_readings": [[1, 2]]}}}
+    base = Path(tempfile.mkdtemp())
+    compact = base / "m.json"
+    write_json(compact, data, pretty=False)
+    assert compact.read_text(encoding="utf-8") == (
+        '{"listings":{"a1":{"price_readings":[[1,2]]}}}'
+    )
+    gz = base / "m.json.gz"
+    write_json(gz, data)
+    assert gz.read_bytes()[:2] == b"\x1f\x8b"
+    assert read_json(gz) == data
@@ -1,7 +1,11 @@
-"""Unit tests for the otomoto search-page parser (no network)."""
+"""Unit tests for the otomoto search-page parser and fetch loop (no network)."""
 
 import json
 
+import httpx
+import pytest
+
+from src.car_scraper.scrapers import autoplac_search, otomoto_search
 from src.car_scraper.scrapers.otomoto_search import parse_listings
 
 
@@ -71,3 +75,45 @@ def test_missing_next_data_is_graceful():
     listings, total = parse_listings("<html>anti-bot wall</html>")
     assert listings == []
     assert total is None
+
+
+def test_scrape_search_reuses_one_client_across_pages(monkeypatch):
+    seen = []
+
+    def handler(request):
+        page = request.url.params.get("page", "1")
+        seen.append((page, request.extensions["timeout"]["read"]))
+        html = _make_html([_advert(id=f"p{page}")], total=40)
+        return httpx.Response(200, text=html)
+
+    clients = []
+    real_client = httpx.Client
+
+    def make_client(**kwargs):
+        clients.append(real_client(transport=httpx.MockTransport(handler), **kwargs))
+        return clients[-1]
+
+    def no_pooled_get(*_args, **_kwargs):
+        raise AssertionError("page fetched outside the shared client")
+
+    monkeypatch.setattr(httpx, "Client", make_client)
+    monkeypatch.setattr(httpx, "get", no_pooled_get)
+
+    listings = otomoto_search.scrape_search("https://x.test/osobowe/a/b", delay=0)
+    assert sorted(x["id"] for x in listings) == ["p1", "p2"]
+    assert len(clients) == 1
+    assert seen == [("1", 30), ("2", 30)]
+
+
+@pytest.mark.parametrize("module", [otomoto_search, autoplac_search])
+def test_fetch_search_page_honours_timeout_with_client(module):
+    timeouts = []
+
+    def handler(request):
+        timeouts.append(request.extensions["timeout"])
+        return httpx.Response(200, text="ok")
+
+    with httpx.Client(transport=httpx.MockTransport(handler), timeout=30) as client:
+        html = module.fetch_search_page("https://x.test/s", 2, timeout=5, client=client)
+    assert html == "ok"
+    assert timeouts == [{"connect": 5, "read": 5, "write": 5, "pool": 5}]
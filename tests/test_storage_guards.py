@@ -1,9 +1,12 @@
 """Regression tests for storage edge cases found in review."""
 
+import json
 import tempfile
 from pathlib import Path
 
-from src.car_scraper.storage import SimplifiedListingsStorage
+import pytest
+
+from src.car_scraper.storage import SimplifiedListingsStorage, simplified_listings
 
 
 def _storage():
@@ -45,3 +48,200 @@ def test_new_then_price_drop_reported():
     )
     assert len(summary["price_drops"]) == 1
     assert summary["price_drops"][0]["new_price"] == 90000
+
+
+def test_external_edit_invalidates_cached_listings():
+    """The per-instance listings cache must not mask a file changed on disk."""
+    storage = _storage()
+    car = {"id": "a", "title": "Car", "price": 100000, "year": 2020}
+    storage.store_listings_data("m", [car], "2025-01-01")
+    data_file = storage._get_model_data_file("m")
+    data = json.loads(data_file.read_text(encoding="utf-8"))
+    data["listings"]["a"]["current_price"] = 120000
+    data["listings"]["a"]["price_readings"].append([1, 120000])
+    data_file.write_text(json.dumps(data), encoding="utf-8")
+
+    summary = storage.store_listings_data("m", [car], "2025-01-02")
+    assert summary["price_drops"][0]["old_price"] == 120000
+
+
+def test_failed_merge_does_not_leave_half_merged_cache(monkeypatch):
+    """A merge that raises must not leave its in-place edits in the cache."""
+    storage = _storage()
+    car = {"id": "a", "title": "Car", "price": 100000, "year": 2020}
+    storage.store_listings_data("m", [car], "2025-01-01")
+
+    def boom(*_args):
+        raise RuntimeError("boom")
+
+    monkeypatch.setattr(simplified_listings, "_carry_extra_fields", boom)
+    with pytest.raises(RuntimeError):
+        storage.store_listings_data("m", [{**car, "price": 90000}], "2025-01-02")
+
+    df = storage.get_historical_data("m")
+    assert df["price"].tolist() == [100000]
+    assert df["date"].tolist() == ["2025-01-01"]
+
+
+def test_historical_data_for_all_models():
+    """Without a model filter, rows from every model file are combined."""
+    storage = _storage()
+    storage.store_listings_data(
+        "m1", [{"id": "a", "title": "A", "price": 100000, "year": 2020}], "2025-01-01"
+    )
+    assert storage.get_historical_data()["id"].tolist() == ["a"]
+    # A model added after the first scan must be picked up.
+    storage.store_listings_data(
+        "m2", [{"id": "b", "title": "B", "price": 200000, "year": 2021}], "2025-01-01"
+    )
+    df = storage.get_historical_data()
+    assert sorted(df["id"]) == ["a", "b"]
+    assert set(df["model"]) == {"m1", "m2"}
+
+
+def test_historical_data_with_empty_price_readings():
+    """A listing without readings still yields its current-price row."""
+    storage = _storage()
+    data_file = storage._get_model_data_file("m")
+    listing = {
+        "id": "a",
+        "title": "Car",
+        "current_price": 100000,
+        "year": 2020,
+        "mileage": 1000,
+        "url": "",
+        "model": "m",
+        "last_seen": "2025-01-01",
+        "last_scrape_timestamp": 1735689600,
+        "price_readings": [],
+    }
+    data_file.write_text(json.dumps({"metadata": {}, "listings": {"a": listing}}))
+    df = storage.get_historical_data("m")
+    assert df["price"].tolist() == [100000]
+
+
+def test_simulate_price_changes_updates_stored_listings():
+    """Simulated changes land in the dict-format file as new price readings."""
+    storage = _storage()
+    listings = [
+        {"id": f"l{i}", "title": "Car", "price": 100000 + i, "year": 2020}
+        for i in range(3)
+    ]
+    storage.store_listings_data("m", listings, "2025-01-01")
+    storage.simulate_price_changes("m", change_count=2)
+    data = json.loads(storage._get_model_data_file("m").read_text())
+    readings = [len(car["price_readings"]) for car in data["listings"].values()]
+    assert sorted(readings) == [1, 2, 2]
+
+
+def test_same_day_rerun_leaves_file_untouched():
+    """Re-storing an identical scrape for the same day skips the rewrite."""
+    storage = _storage()
+    listings = [{"id": "a", "title": "Car", "price": 100000, "year": 2020}]
+    storage.store_listings_data("m", listings, "2025-01-01")
+    data_file = storage._get_model_data_file("m")
+    before = data_file.stat().st_mtime_ns
+    summary = storage.store_listings_data("m", listings, "2025-01-01")
+    assert data_file.stat().st_mtime_ns == before
+    assert summary["total"] == 1
+    assert summary["new"] == [] and summary["price_changes"] == 0
+    # A changed price on the same day is still recorded.
+    listings[0]["price"] = 95000
+    summary = storage.store_listings_data("m", listings, "2025-01-01")
+    assert summary["price_changes"] == 1
+
+
+def test_summary_stats_for_dict_format():
+    """Summary stats count listings, not the file's top-level keys."""
+    storage = _storage()
+    listings = [
+        {"id": "a", "title": "A", "price": 100000, "year": 2020},
+        {"id": "b", "title": "B", "price": 200000, "year": 2021},
+    ]
+    storage.store_listings_data("m", listings, "2025-01-01")
+    listings[0]["price"] = 90000
+    storage.store_listings_data("m", listings, "2025-01-02")
+    stats = storage.get_summary_stats("m")
+    assert stats["total_listings"] == 2
+    assert stats["listings_with_price_changes"] == 1
+    assert stats["average_current_price"] == 145000
+
+
+def test_old_list_format_is_read_without_rewriting():
+    """Reading an old list-format file converts it in memory only."""
+    storage = _storage()
+    data_file = storage._get_model_data_file("m")
+    data_file.parent.mkdir(parents=True, exist_ok=True)
+    old = [
+        {
+            "id": "a",
+            "title": "Car",
+            "price": 100000,
+            "scrape_date": "2025-05-30T10:00:00",
+            "scrape_timestamp": 1748550000,
+        }
+    ]
+    data_file.write_text(json.dumps(old), encoding="utf-8")
+
+    df = storage.get_historical_data("m")
+    assert df["price"].tolist() == [100000]
+    assert df["date"].tolist() == ["2025-05-30"]
+    assert storage.get_summary_stats("m")["total_listings"] == 1
+
+    assert json.loads(data_file.read_text(encoding="utf-8")) == old
+    assert not data_file.with_name("m.json.pre-migrate").exists()
+
+
+def test_old_list_format_is_migrated_on_store():
+    """The first store keeps every old scrape and backs up the old file."""
+    storage = _storage()
+    data_file = storage._get_model_data_file("m")
+    data_file.parent.mkdir(parents=True, exist_ok=True)
+    old = [
+        {
+            "id": "a",
+            "title": "Car",
+            "price": 95000,
+            "scrape_date": "2025-05-30T10:00:00",
+            "scrape_timestamp": 1748592000,
+        },
+        {
+            "id": "a",
+            "title": "Car",
+            "price": 100000,
+            "scrape_date": "2025-05-29T10:00:00",
+            "scrape_timestamp": 1748505600,
+        },
+        {
+            "id": "b",
+            "title": "Unpriced",
+            "price": None,
+            "scrape_date": "2025-05-30T10:00:00",
+            "scrape_timestamp": 1748592000,
+        },
+    ]
+    data_file.write_text(json.dumps(old), encoding="utf-8")
+
+    df = storage.get_historical_data("m")
+    assert sorted(df["price"].tolist()) == [95000, 100000]
+
+    scrape = [
+        {"id": "a", "title": "Car", "price": 95000},
+        {"id": "b", "title": "Unpriced", "price": 50000},
+    ]
+    summary = storage.store_listings_data("m", scrape, "2025-05-31")
+    # No made-up 0 -> price change for the listing that never had a price
+    assert summary["price_changes"] == 0
+    assert [x["id"] for x in summary["new"]] == ["b"]
+
+    listings = json.loads(data_file.read_text(encoding="utf-8"))["listings"]
+    a = listings["a"]
+    assert a["price_readings"] == [[1748505600, 100000], [1748592000, 95000]]
+    assert a["initial_price"] == 100000
+    assert a["current_price"] == 95000
+    assert a["price_change"] == -5000
+    assert a["first_seen"] == "2025-05-29"
+    assert a["last_seen"] == "2025-05-31"
+    assert listings["b"]["current_price"] == 50000
+    backup = data_file.with_name("m.json.pre-migrate")
+    assert json.loads(backup.read_text(encoding="utf-8")) == old